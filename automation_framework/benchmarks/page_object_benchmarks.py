@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for page object operations against a locally served storefront
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from playwright.sync_api import Page, sync_playwright
+
+from benchmarks.storefront import Storefront
+from config.config import Config
+from pages.cart_page import CartPage
+from pages.login_page import LoginPage
+from pages.products_page import ProductsPage
+
+
+class Benchmark:
+    """A page object operation measured at several catalogue or cart sizes"""
+
+    def __init__(self, name: str, size_kind: str, path: str, run: Callable[[Page], Any],
+                 before_each: Optional[Callable[[Page, str], None]] = None):
+        self.name = name
+        self.size_kind = size_kind
+        self.path = path
+        self.run = run
+        self.before_each = before_each
+
+
+def _open_login(page: Page, base_url: str) -> None:
+    page.goto(f"{base_url}/")
+
+
+def _login(page: Page) -> None:
+    credentials = Config.get_test_data()
+    LoginPage(page).login(credentials["valid_username"], credentials["valid_password"])
+    page.wait_for_url("**/inventory.html")
+
+
+BENCHMARKS = [
+    Benchmark("LoginPage.login", "catalogue", "/", _login, before_each=_open_login),
+    Benchmark("ProductsPage.get_product_names", "catalogue", "/inventory.html",
+              lambda page: ProductsPage(page).get_product_names()),
+    Benchmark("ProductsPage.verify_products_sorted_a_to_z", "catalogue", "/inventory.html",
+              lambda page: ProductsPage(page).verify_products_sorted_a_to_z()),
+    Benchmark("ProductsPage.add_first_product_to_cart", "catalogue", "/inventory.html",
+              lambda page: ProductsPage(page).add_first_product_to_cart()),
+    Benchmark("CartPage.get_cart_item_names", "cart", "/cart.html",
+              lambda page: CartPage(page).get_cart_item_names()),
+]
+
+
+def summarize(samples_ms: List[float]) -> Dict[str, float]:
+    """Summary statistics of timing samples in milliseconds"""
+    ordered = sorted(samples_ms)
+    return {
+        "rounds": len(ordered),
+        "min_ms": round(ordered[0], 3),
+        "max_ms": round(ordered[-1], 3),
+        "mean_ms": round(statistics.mean(ordered), 3),
+        "median_ms": round(statistics.median(ordered), 3),
+        "stdev_ms": round(statistics.stdev(ordered), 3) if len(ordered) > 1 else 0.0,
+        "p95_ms": round(ordered[min(int(len(ordered) * 0.95), len(ordered) - 1)], 3),
+    }
+
+
+def run_benchmark(page: Page, storefront: Storefront, benchmark: Benchmark, repetitions: int,
+                  warmup: int) -> Dict[str, float]:
+    """Time one benchmark at the storefront's current size, after warm-up rounds"""
+    page.goto(f"{storefront.base_url}{benchmark.path}")
+    samples = []
+    for round_index in range(warmup + repetitions):
+        if benchmark.before_each:
+            benchmark.before_each(page, storefront.base_url)
+        start = time.perf_counter()
+        benchmark.run(page)
+        elapsed = (time.perf_counter() - start) * 1000
+        if round_index >= warmup:
+            samples.append(elapsed)
+    return summarize(samples)
+
+
+def run_suite(catalogue_sizes: List[int], cart_sizes: List[int], repetitions: int,
+              warmup: int) -> Dict[str, Dict[str, float]]:
+    """Run every benchmark at every size and return statistics keyed by benchmark and size"""
+    browser_config = Config.get_browser_config()
+    results = {}
+    with Storefront() as storefront, sync_playwright() as playwright:
+        browser_name = browser_config.get("name", "chromium")
+        browser_type = getattr(playwright, browser_name, playwright.chromium)
+        browser = browser_type.launch(headless=True)
+        context = browser.new_context(viewport=browser_config.get("viewport"))
+        page = context.new_page()
+
+        for benchmark in BENCHMARKS:
+            sizes = catalogue_sizes if benchmark.size_kind == "catalogue" else cart_sizes
+            for size in sizes:
+                is_catalogue = benchmark.size_kind == "catalogue"
+                storefront.catalogue_size = size if is_catalogue else catalogue_sizes[0]
+                storefront.cart_size = cart_sizes[0] if is_catalogue else size
+                key = f"{benchmark.name}[{benchmark.size_kind}={size}]"
+                results[key] = run_benchmark(page, storefront, benchmark, repetitions, warmup)
+                print(f"  {key:<65} median {results[key]['median_ms']:9.2f} ms  "
+                      f"stdev {results[key]['stdev_ms']:8.2f} ms")
+
+        context.close()
+        browser.close()
+    return results
+
+
+def compare_with_baseline(results: Dict[str, Dict[str, float]],
+                          baseline: Dict[str, Dict[str, float]],
+                          threshold: float) -> List[Dict[str, Any]]:
+    """Return the benchmarks whose median grew by more than ``threshold`` over the baseline"""
+    regressions = []
+    for key, stats in results.items():
+        if key not in baseline:
+            continue
+        baseline_median = baseline[key]["median_ms"]
+        if not baseline_median:
+            continue
+        change = (stats["median_ms"] - baseline_median) / baseline_median
+        if change > threshold:
+            regressions.append({
+                "benchmark": key,
+                "baseline_median_ms": baseline_median,
+                "median_ms": stats["median_ms"],
+                "change": round(change, 3),
+            })
+    return regressions
+
+
+def save_json(path: Path, data: Dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=2)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    benchmark_config = Config.get_benchmark_config()
+    parser = argparse.ArgumentParser(description="Page object benchmark suite")
+    parser.add_argument("--catalogue-sizes", type=int, nargs="+",
+                        default=benchmark_config["catalogue_sizes"],
+                        help="Catalogue sizes to benchmark product operations at")
+    parser.add_argument("--cart-sizes", type=int, nargs="+", default=benchmark_config["cart_sizes"],
+                        help="Cart sizes to benchmark cart operations at")
+    parser.add_argument("--repetitions", type=int, default=benchmark_config["repetitions"],
+                        help="Measured rounds per benchmark and size")
+    parser.add_argument("--warmup", type=int, default=benchmark_config["warmup"],
+                        help="Unmeasured rounds before measuring")
+    parser.add_argument("--threshold", type=float, default=benchmark_config["threshold"],
+                        help="Allowed median slowdown over the baseline (0.2 = 20%%)")
+    parser.add_argument("--baseline", default=benchmark_config["baseline"],
+                        help="Baseline results file")
+    parser.add_argument("--output", default=benchmark_config["output"], help="Results file")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="Store these results as the new baseline")
+    args = parser.parse_args(argv)
+
+    print(f"⏱️  Running page object benchmarks ({args.repetitions} rounds, {args.warmup} warm-up)")
+    results = run_suite(args.catalogue_sizes, args.cart_sizes, args.repetitions, args.warmup)
+
+    baseline_path = Path(args.baseline)
+    baseline = {}
+    if baseline_path.exists() and not args.save_baseline:
+        with open(baseline_path, 'r') as f:
+            baseline = json.load(f)["results"]
+    regressions = compare_with_baseline(results, baseline, args.threshold)
+
+    output = {
+        "timestamp": datetime.now().isoformat(),
+        "repetitions": args.repetitions,
+        "warmup": args.warmup,
+        "threshold": args.threshold,
+        "baseline": str(baseline_path) if baseline else None,
+        "regressions": regressions,
+        "results": results,
+    }
+    save_json(Path(args.output), output)
+    print(f"📊 Results saved: {args.output}")
+
+    if args.save_baseline:
+        save_json(baseline_path, output)
+        print(f"📌 Baseline saved: {baseline_path}")
+        return 0
+    if not baseline:
+        print(f"ℹ️  No baseline found at {baseline_path}, run with --save-baseline to create one")
+        return 0
+    if regressions:
+        print(f"❌ {len(regressions)} benchmark(s) regressed by more than {args.threshold:.0%}:")
+        for regression in regressions:
+            print(f"  {regression['benchmark']}: {regression['baseline_median_ms']:.2f} ms -> "
+                  f"{regression['median_ms']:.2f} ms (+{regression['change']:.0%})")
+        return 1
+    print("✅ No benchmark regressed past the threshold")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
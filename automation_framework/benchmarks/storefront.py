@@ -0,0 +1,167 @@
+import random
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List
+
+# Minimal copy of the SauceDemo markup, using the same locators as the page objects
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>Swag Labs</title></head>
+<body>{body}</body></html>"""
+
+LOGIN_BODY = """
+<div class="login_logo">Swag Labs</div>
+<form id="login_form">
+    <input data-test="username" id="user-name" type="text" placeholder="Username">
+    <input data-test="password" id="password" type="password" placeholder="Password">
+    <div class="error-message-container"></div>
+    <input data-test="login-button" id="login-button" type="submit" value="Login">
+</form>
+<script>
+document.getElementById('login_form').addEventListener('submit', event => {
+    event.preventDefault();
+    const username = document.getElementById('user-name').value;
+    const password = document.getElementById('password').value;
+    if (username && password === 'secret_sauce') {
+        window.location.href = 'inventory.html';
+        return;
+    }
+    document.querySelector('.error-message-container').innerHTML =
+        '<h3 data-test="error">Epic sadface: ' +
+        'Username and password do not match any user in this service' +
+        '<button class="error-button" data-test="error-button">x</button></h3>';
+});
+</script>
+"""
+
+INVENTORY_ITEM = """
+<div class="inventory_item">
+    <div class="inventory_item_name">{name}</div>
+    <div class="inventory_item_price">${price}</div>
+    <button class="btn btn_inventory" data-test="add-to-cart-{slug}">Add to cart</button>
+</div>"""
+
+INVENTORY_BODY = """
+<a class="shopping_cart_link" href="cart.html"><span class="shopping_cart_badge"></span></a>
+<span class="title">Products</span>
+<select data-test="product_sort_container">
+    <option value="az">Name (A to Z)</option>
+    <option value="za">Name (Z to A)</option>
+</select>
+<div class="inventory_container"><div class="inventory_list">{items}</div></div>
+<script>
+let cartCount = 0;
+document.querySelectorAll('.btn_inventory').forEach(button => {
+    button.addEventListener('click', () => {
+        cartCount += 1;
+        document.querySelector('.shopping_cart_badge').textContent = cartCount;
+    });
+});
+document.querySelector('[data-test="product_sort_container"]').addEventListener('change', event => {
+    const list = document.querySelector('.inventory_list');
+    const items = Array.from(list.children);
+    const name = item => item.querySelector('.inventory_item_name').textContent;
+    items.sort((a, b) => name(a).localeCompare(name(b)));
+    if (event.target.value === 'za') items.reverse();
+    items.forEach(item => list.appendChild(item));
+});
+</script>
+"""
+
+CART_ITEM = """
+<div class="cart_item">
+    <div class="cart_quantity">1</div>
+    <div class="inventory_item_name">{name}</div>
+    <button class="btn cart_button">Remove</button>
+</div>"""
+
+CART_BODY = """
+<span class="title">Your Cart</span>
+<div class="cart_list">{items}</div>
+<button data-test="continue-shopping" onclick="window.location.href='inventory.html'">
+    Continue Shopping
+</button>
+<button data-test="checkout">Checkout</button>
+<script>
+document.querySelectorAll('.cart_button').forEach(button => button.addEventListener('click', () => {
+    button.closest('.cart_item').remove();
+}));
+</script>
+"""
+
+
+class Storefront:
+    """Locally served storefront with a configurable catalogue and cart size"""
+
+    def __init__(self, catalogue_size: int = 6, cart_size: int = 1, seed: int = 42):
+        self.catalogue_size = catalogue_size
+        self.cart_size = cart_size
+        self.seed = seed
+        self._server = None
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def get_product_names(self, count: int) -> List[str]:
+        """Product names in a fixed shuffled order, so sorting always has work to do"""
+        names = [f"Test Product {index:05d}" for index in range(count)]
+        random.Random(self.seed).shuffle(names)
+        return names
+
+    def render(self, path: str) -> str:
+        if path in ("/", "/index.html"):
+            body = LOGIN_BODY
+        elif path == "/inventory.html":
+            items = "".join(
+                INVENTORY_ITEM.format(name=name, price=f"{9.99 + index % 40:.2f}",
+                                      slug=name.lower().replace(" ", "-"))
+                for index, name in enumerate(self.get_product_names(self.catalogue_size))
+            )
+            body = INVENTORY_BODY.replace("{items}", items)
+        elif path == "/cart.html":
+            names = self.get_product_names(self.cart_size)
+            items = "".join(CART_ITEM.format(name=name) for name in names)
+            body = CART_BODY.replace("{items}", items)
+        else:
+            return ""
+        return PAGE_TEMPLATE.format(body=body)
+
+    def _create_handler(self):
+        storefront = self
+
+        class StorefrontHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                html = storefront.render(self.path.split("?")[0])
+                content = html.encode("utf-8")
+                self.send_response(200 if html else 404)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            def log_message(self, format, *args):
+                pass
+
+        return StorefrontHandler
+
+    def start(self) -> "Storefront":
+        """Serve the storefront on a free local port in a background thread"""
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._create_handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, name="storefront",
+                                        daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "Storefront":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
@@ -1,3 +1,4 @@
+import copy
 import os
 from pathlib import Path
 from typing import Dict, Any
@@ -17,7 +18,8 @@ class Config:
             "name": "chromium",
             "headless": False,
             "timeout": 30000,
-            "viewport": {"width": 1280, "height": 720}
+            "viewport": {"width": 1280, "height": 720},
+            "reuse_page": False
         },
         "test_data": {
             "valid_username": "standard_user",
@@ -34,21 +36,73 @@ class Config:
             "enabled": True,
             "on_failure": True,
             "path": "reports/screenshots"
+        },
+        "visual": {
+            "baseline_dir": "tests/visual_baselines",
+            "output_dir": "reports/visual",
+            "tolerance": 8,
+            "max_diff_ratio": 0.001,
+            "tile_size": 32,
+            "update_baselines": False,
+            "workers": 4,
+            "parallel_threshold": 4
+        },
+        "profiling": {
+            "selectors": False,
+            "catalogue_selector": ".inventory_item",
+            "catalogue_sizes": [6, 60, 300, 600],
+            "repetitions": 5,
+            "report_top": 10
+        },
+        "rerun": {
+            "retries": 0,
+            "backoff": 1.0
+        },
+        "monitoring": {
+            "resources": False,
+            "interval": 0.2,
+            "growth_threshold_mb": 2.0,
+            "min_tests": 5
+        },
+        "benchmark": {
+            "catalogue_sizes": [6, 100, 500],
+            "cart_sizes": [1, 25, 100],
+            "repetitions": 30,
+            "warmup": 3,
+            "threshold": 0.2,
+            "baseline": "benchmarks/baseline.json",
+            "output": "reports/benchmarks/benchmark_results.json"
         }
     }
     
+    # Parsed configuration per environment, read once per process
+    _cache: Dict[str, Dict[str, Any]] = {}
+    
     @classmethod
     def load_config(cls, env: str = "default") -> Dict[str, Any]:
         """Load configuration from file or return default"""
+        if env not in cls._cache:
+            cls._cache[env] = cls._read_config(env)
+        # Callers may modify the returned sections, so never hand out the cached dict
+        return copy.deepcopy(cls._cache[env])
+    
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Forget loaded configuration so the next call re-reads files and environment"""
+        cls._cache = {}
+    
+    @classmethod
+    def _read_config(cls, env: str) -> Dict[str, Any]:
+        """Read configuration file and apply environment variable overrides"""
         config_file = cls.CONFIG_DIR / f"{env}.yaml"
         
         if config_file.exists():
             with open(config_file, 'r') as f:
                 file_config = yaml.safe_load(f)
                 # Merge with default config
-                config = {**cls.DEFAULT_CONFIG, **file_config}
+                config = {**copy.deepcopy(cls.DEFAULT_CONFIG), **file_config}
         else:
-            config = cls.DEFAULT_CONFIG.copy()
+            config = copy.deepcopy(cls.DEFAULT_CONFIG)
             
         # Override with environment variables
         if os.getenv("BASE_URL"):
@@ -61,6 +115,22 @@ class Config:
         if headless_env:
             config["browser"]["headless"] = headless_env.lower() == "true"
             
+        reuse_page_env = os.getenv("REUSE_PAGE")
+        if reuse_page_env:
+            config["browser"]["reuse_page"] = reuse_page_env.lower() == "true"
+            
+        update_baselines_env = os.getenv("UPDATE_VISUAL_BASELINES")
+        if update_baselines_env:
+            config["visual"]["update_baselines"] = update_baselines_env.lower() == "true"
+            
+        profile_selectors_env = os.getenv("PROFILE_SELECTORS")
+        if profile_selectors_env:
+            config["profiling"]["selectors"] = profile_selectors_env.lower() == "true"
+            
+        monitor_resources_env = os.getenv("MONITOR_RESOURCES")
+        if monitor_resources_env:
+            config["monitoring"]["resources"] = monitor_resources_env.lower() == "true"
+            
         return config
     
     @classmethod
@@ -73,4 +143,24 @@ class Config:
     
     @classmethod
     def get_test_data(cls) -> Dict[str, Any]:
-        return cls.load_config().get("test_data", cls.DEFAULT_CONFIG["test_data"])
\ No newline at end of file
+        return cls.load_config().get("test_data", cls.DEFAULT_CONFIG["test_data"])
+    
+    @classmethod
+    def get_visual_config(cls) -> Dict[str, Any]:
+        return cls.load_config().get("visual", cls.DEFAULT_CONFIG["visual"])
+    
+    @classmethod
+    def get_profiling_config(cls) -> Dict[str, Any]:
+        return cls.load_config().get("profiling", cls.DEFAULT_CONFIG["profiling"])
+    
+    @classmethod
+    def get_rerun_config(cls) -> Dict[str, Any]:
+        return cls.load_config().get("rerun", cls.DEFAULT_CONFIG["rerun"])
+    
+    @classmethod
+    def get_monitoring_config(cls) -> Dict[str, Any]:
+        return cls.load_config().get("monitoring", cls.DEFAULT_CONFIG["monitoring"])
+    
+    @classmethod
+    def get_benchmark_config(cls) -> Dict[str, Any]:
+        return cls.load_config().get("benchmark", cls.DEFAULT_CONFIG["benchmark"])
\ No newline at end of file
@@ -9,6 +9,9 @@ sys.path.insert(0, str(project_root))
 # Import all fixtures
 from fixtures.browser_fixtures import *
 
+# Hook plugins, registered once for the whole session
+pytest_plugins = ["fixtures.rerun_plugin", "fixtures.resource_plugin"]
+
 def pytest_configure(config):
     """Configure pytest"""
     # Create reports directory
@@ -2,8 +2,13 @@ import pytest
 from playwright.sync_api import Browser, BrowserContext, Page, Playwright, sync_playwright
 from typing import Generator
 from config.config import Config
+from pages.base_page import RESET_PAGE_STATE_JS, BasePage
 from utils.logger import Logger
 from utils.helpers import ScreenshotHelper
+from utils.resource_monitor import ResourceMonitor
+from utils.selector_profiler import SelectorProfiler
+from utils.test_data_store import TestDataStore, UserAccount
+from utils.visual_regression import VisualComparator
 
 logger = Logger.get_logger("fixtures")
 
@@ -35,12 +40,18 @@ def browser(playwright: Playwright, browser_config) -> Generator[Browser, None,
         browser = playwright.webkit.launch(headless=headless)
     else:
         browser = playwright.chromium.launch(headless=headless)
+    ResourceMonitor.register_browser(browser)
     
     yield browser
     logger.info("Closing browser")
+    ResourceMonitor.unregister_browser()
     browser.close()
 
-@pytest.fixture(scope="function")
+def page_scope(fixture_name: str, config) -> str:
+    """Share one context and page across tests when page reuse is enabled"""
+    return "session" if Config.get_browser_config().get("reuse_page", False) else "function"
+
+@pytest.fixture(scope=page_scope)
 def context(browser: Browser, browser_config) -> Generator[BrowserContext, None, None]:
     """Browser context fixture for each test function"""
     viewport = browser_config.get("viewport", {"width": 1280, "height": 720})
@@ -50,12 +61,18 @@ def context(browser: Browser, browser_config) -> Generator[BrowserContext, None,
         viewport=viewport,
         record_video_dir="reports/videos" if Config.load_config().get("record_video", False) else None
     )
+    # A context shared by page reuse stays open between tests on purpose
+    shared = browser_config.get("reuse_page", False)
+    if shared:
+        ResourceMonitor.set_shared_context(context)
     
     yield context
     logger.info("Closing browser context")
+    if shared:
+        ResourceMonitor.set_shared_context(None)
     context.close()
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope=page_scope)
 def page(context: BrowserContext) -> Generator[Page, None, None]:
     """Page fixture for each test function"""
     logger.info("Creating new page")
@@ -66,9 +83,20 @@ def page(context: BrowserContext) -> Generator[Page, None, None]:
     page.on("pageerror", lambda error: logger.error(f"Page error: {error}"))
     
     yield page
+    stats = BasePage.get_navigation_stats()
+    logger.info(f"Navigations: {stats['full_navigations']} full, "
+                f"{stats['soft_resets']} saved by soft reset")
     logger.info("Closing page")
     page.close()
 
+@pytest.fixture(autouse=True)
+def reset_shared_page(page: Page, browser_config):
+    """Start every test with no cookies or web storage when the page is shared between tests"""
+    if browser_config.get("reuse_page", False) and not page.is_closed():
+        page.context.clear_cookies()
+        page.evaluate(RESET_PAGE_STATE_JS)
+    yield
+
 @pytest.fixture(scope="function")
 def base_url():
     """Base URL fixture"""
@@ -79,6 +107,43 @@ def test_data():
     """Test data fixture"""
     return Config.get_test_data()
 
+def is_standard_account(account: UserAccount) -> bool:
+    return account.role == "standard"
+
+@pytest.fixture(scope="session")
+def user_account() -> UserAccount:
+    """Standard login account owned by this xdist worker, never shared with other workers"""
+    return TestDataStore.get_worker_record("users", is_standard_account)
+
+@pytest.fixture(scope="session")
+def account_with_role():
+    """Look up a defect account, such as the locked out account, by its role"""
+    def find(role: str) -> UserAccount:
+        return TestDataStore.find_record("users", role=role)
+    return find
+
+@pytest.fixture(scope="session")
+def visual_comparator() -> Generator[VisualComparator, None, None]:
+    """Visual regression comparator shared by the session"""
+    comparator = VisualComparator.from_config()
+    yield comparator
+    comparator.write_report()
+
+@pytest.fixture(scope="session")
+def selector_profiler() -> Generator[type, None, None]:
+    """Selector profiler shared by the session, writes its report at the end"""
+    yield SelectorProfiler
+    if SelectorProfiler.is_enabled():
+        SelectorProfiler.write_report()
+
+@pytest.fixture(autouse=True)
+def profile_selectors(selector_profiler, page: Page):
+    """Benchmark the selectors a test used against the live DOM in profiling mode"""
+    yield
+    
+    if selector_profiler.is_enabled() and not page.is_closed():
+        selector_profiler.benchmark_visited_pages(page)
+
 @pytest.fixture(autouse=True)
 def take_screenshot_on_failure(request, page: Page):
     """Automatically take screenshot on test failure"""
@@ -88,7 +153,10 @@ def take_screenshot_on_failure(request, page: Page):
         if request.node.rep_setup.failed or request.node.rep_call.failed:
             screenshot_dir = ScreenshotHelper.create_screenshot_dir()
             test_name = request.node.name
-            screenshot_name = ScreenshotHelper.generate_screenshot_name(test_name, "failure")
+            attempt = getattr(request.node, "execution_count", 1)
+            screenshot_name = ScreenshotHelper.generate_screenshot_name(
+                test_name, f"failure_attempt{attempt}"
+            )
             screenshot_path = screenshot_dir / screenshot_name
             
             logger.info(f"Test failed, taking screenshot: {screenshot_path}")
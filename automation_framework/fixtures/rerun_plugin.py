@@ -0,0 +1,198 @@
+import json
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+from _pytest.runner import runtestprotocol
+
+from config.config import Config
+from utils.logger import Logger
+
+logger = Logger.get_logger("rerun")
+
+RESULTS_PATH = Path("reports/rerun_results.json")
+
+
+class RerunState:
+    """Tracks failed items waiting for a retry and the outcome of every attempt"""
+
+    def __init__(self, retries: int, backoff: float):
+        self.retries = retries
+        self.backoff = backoff
+        self.pending: List[pytest.Item] = []
+        self.attempts: Dict[str, List[Dict[str, Any]]] = {}
+        self.flaky: List[str] = []
+        self.failed: List[str] = []
+
+    def get_delay(self, attempt: int) -> float:
+        """Exponential backoff before the given attempt (the first retry is attempt 2)"""
+        return self.backoff * 2 ** (attempt - 2)
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("rerun", "in-session rerun of failed tests")
+    group.addoption("--retry-failed", type=int, default=None,
+                    help="Number of times to retry failed tests at the end of the session")
+    group.addoption("--retry-backoff", type=float, default=None,
+                    help="Seconds to wait before the first retry, doubled for each further retry")
+
+
+def pytest_configure(config):
+    rerun_config = Config.get_rerun_config()
+    retries = config.getoption("retry_failed")
+    backoff = config.getoption("retry_backoff")
+    config._rerun_state = RerunState(
+        retries=rerun_config.get("retries", 0) if retries is None else retries,
+        backoff=rerun_config.get("backoff", 1.0) if backoff is None else backoff,
+    )
+    # Warn once on the xdist controller, not on every worker
+    is_controller = not hasattr(config, "workerinput")
+    if config._rerun_state.retries > 0 and _is_distributed(config) and is_controller:
+        config.issue_config_time_warning(pytest.PytestConfigWarning(
+            "Retrying failed tests is not supported with pytest-xdist, "
+            "failed tests will not be retried"
+        ), stacklevel=2)
+
+
+def _is_distributed(config) -> bool:
+    # xdist runs its own test loop on the controller and on every worker
+    return getattr(config.option, "dist", "no") != "no" or hasattr(config, "workerinput")
+
+
+def _is_enabled(config) -> bool:
+    return config._rerun_state.retries > 0 and not _is_distributed(config)
+
+
+def _reset_shared_page(item: pytest.Item) -> None:
+    """Tear down a page and context shared by page reuse, so the retry sets up fresh ones"""
+    fixturedefs = item._fixtureinfo.name2fixturedefs
+    shared = [fixturedefs[name][-1] for name in ("page", "context")
+              if name in fixturedefs and fixturedefs[name][-1].scope == "session"]
+    if not shared:
+        return
+    if not item._request:
+        item._initrequest()
+    for fixturedef in shared:
+        fixturedef.finish(item._request)
+
+
+def _record_attempt(state: RerunState, item: pytest.Item, reports: List[pytest.TestReport]) -> None:
+    failed = [report for report in reports if report.failed]
+    # Captured sections accumulate over the phases, so the last report holds all of them
+    captured = reports[-1]
+    state.attempts.setdefault(item.nodeid, []).append({
+        "attempt": item.execution_count,
+        "outcome": "failed" if failed else "passed",
+        "duration": sum(report.duration for report in reports),
+        "failed_phase": failed[0].when if failed else None,
+        "error": failed[0].longreprtext if failed else None,
+        "log": captured.caplog,
+        "stdout": captured.capstdout,
+        "stderr": captured.capstderr,
+    })
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtestloop(session):
+    """Run all tests, then retry failures on the still-running session fixtures"""
+    config = session.config
+    if not _is_enabled(config) or config.option.collectonly:
+        return None
+    if session.testsfailed and not config.option.continue_on_collection_errors:
+        return None
+
+    state = config._rerun_state
+    for index, item in enumerate(session.items):
+        # Tearing down only up to the session keeps the browser warm for the retries
+        nextitem = session.items[index + 1] if index + 1 < len(session.items) else session
+        item.config.hook.pytest_runtest_protocol(item=item, nextitem=nextitem)
+        if session.shouldfail:
+            raise session.Failed(session.shouldfail)
+        if session.shouldstop:
+            raise session.Interrupted(session.shouldstop)
+
+    while state.pending:
+        item = state.pending.pop(0)
+        attempt = item.execution_count + 1
+        delay = state.get_delay(attempt)
+        logger.info(f"Retrying {item.nodeid} (attempt {attempt}/{state.retries + 1}) "
+                    f"in {delay:.1f}s")
+        time.sleep(delay)
+        _reset_shared_page(item)
+        item.config.hook.pytest_runtest_protocol(item=item, nextitem=session)
+        if session.shouldstop:
+            raise session.Interrupted(session.shouldstop)
+
+    session._setupstate.teardown_exact(None)
+    return True
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_protocol(item, nextitem):
+    """Run one attempt of a test, reporting a retryable failure as a rerun"""
+    if not _is_enabled(item.config):
+        return None
+
+    state = item.config._rerun_state
+    item.execution_count = getattr(item, "execution_count", 0) + 1
+    logger.info(f"Running {item.nodeid} (attempt {item.execution_count})")
+
+    # Start every attempt with empty capture sections
+    item._report_sections = []
+    item.ihook.pytest_runtest_logstart(nodeid=item.nodeid, location=item.location)
+    reports = runtestprotocol(item, nextitem=nextitem, log=False)
+    _record_attempt(state, item, reports)
+
+    failed = any(report.failed for report in reports)
+    if failed and item.execution_count <= state.retries:
+        for report in reports:
+            if report.failed:
+                report.outcome = "rerun"
+        state.pending.insert(0, item)
+    elif failed:
+        state.failed.append(item.nodeid)
+    elif item.execution_count > 1:
+        state.flaky.append(item.nodeid)
+        for report in reports:
+            report.flaky = True
+            report.user_properties.append(("flaky", item.execution_count))
+
+    for report in reports:
+        item.ihook.pytest_runtest_logreport(report=report)
+    item.ihook.pytest_runtest_logfinish(nodeid=item.nodeid, location=item.location)
+    return True
+
+
+def pytest_report_teststatus(report):
+    if report.outcome == "rerun":
+        return "rerun", "R", ("RERUN", {"yellow": True})
+    if report.when == "call" and report.passed and getattr(report, "flaky", False):
+        return "flaky", "f", ("FLAKY", {"yellow": True})
+    return None
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if not _is_enabled(config):
+        return
+
+    state = config._rerun_state
+    if state.flaky:
+        terminalreporter.section("flaky tests (passed on retry)")
+        for nodeid in state.flaky:
+            terminalreporter.line(f"{nodeid} - passed on attempt {len(state.attempts[nodeid])}")
+    if state.failed:
+        terminalreporter.section("failed after retries")
+        for nodeid in state.failed:
+            terminalreporter.line(f"{nodeid} - failed {len(state.attempts[nodeid])} attempts")
+
+    RESULTS_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with open(RESULTS_PATH, 'w') as f:
+        json.dump({
+            "retries": state.retries,
+            "backoff": state.backoff,
+            "flaky": state.flaky,
+            "failed": state.failed,
+            "attempts": {nodeid: attempts for nodeid, attempts in state.attempts.items()
+                         if len(attempts) > 1 or nodeid in state.failed},
+        }, f, indent=2)
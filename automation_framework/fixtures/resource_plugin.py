@@ -0,0 +1,49 @@
+import pytest
+
+from utils.logger import Logger
+from utils.resource_monitor import ResourceMonitor
+
+logger = Logger.get_logger("resource_monitor")
+
+
+def pytest_sessionstart(session):
+    ResourceMonitor.start()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    """Measure resource usage of each test, from setup to the end of teardown"""
+    ResourceMonitor.start_test()
+    yield
+    ResourceMonitor.finish_test(item.nodeid)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    records = ResourceMonitor.get_records()
+    if not records:
+        return
+
+    terminalreporter.section("resource usage per test")
+    for line in ResourceMonitor.format_table():
+        terminalreporter.line(line)
+
+    leaked = [record for record in records if record["leaked_contexts"]]
+    if leaked:
+        terminalreporter.line("")
+        terminalreporter.line(f"{len(leaked)} test(s) left browser contexts open:", yellow=True)
+        for record in leaked:
+            terminalreporter.line(f"  {record['test']} ({record['leaked_contexts']} context(s))",
+                                  yellow=True)
+
+    growth = ResourceMonitor.detect_memory_growth()
+    if growth:
+        message = f"Memory grows steadily across the session: about {growth:.1f} MB per test"
+        logger.warning(message)
+        terminalreporter.line("")
+        terminalreporter.line(message, yellow=True, bold=True)
+
+    ResourceMonitor.write_report()
+
+
+def pytest_unconfigure(config):
+    ResourceMonitor.stop()
@@ -1,11 +1,37 @@
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from typing import Any, ContextManager, Dict, List, Optional, Sequence
+from pathlib import Path
+from urllib.parse import urlparse
 from playwright.sync_api import Page, Locator, expect
 import logging
+from utils.helpers import ScreenshotHelper
+from utils.selector_profiler import SelectorProfiler
+from utils.visual_regression import ComparisonRequest, ComparisonResult, Region, VisualComparator
+
+# Empties form fields through the native setter so framework-controlled inputs see the change
+RESET_PAGE_STATE_JS = """() => {
+    const setValue = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+    const inputs = 'input:not([type=submit]):not([type=button]):not([type=hidden])';
+    document.querySelectorAll(inputs).forEach(input => {
+        if (input.type === 'checkbox' || input.type === 'radio') {
+            input.checked = input.defaultChecked;
+        } else {
+            setValue.call(input, '');
+        }
+        input.dispatchEvent(new Event('input', { bubbles: true }));
+    });
+    try {
+        localStorage.clear();
+        sessionStorage.clear();
+    } catch (e) {}
+}"""
 
 class BasePage(ABC):
     """Base page class for all page objects"""
     
+    # Navigation counters shared by all page objects
+    navigation_stats = {"full_navigations": 0, "soft_resets": 0}
+    
     def __init__(self, page: Page):
         self.page = page
         self.logger = logging.getLogger(self.__class__.__name__)
@@ -25,6 +51,40 @@ class BasePage(ABC):
         self.logger.info(f"Navigating to: {url}")
         self.page.goto(url)
     
+    def open(self, base_url: str) -> None:
+        """Open the page, resetting it in place if the browser is already there"""
+        url = base_url.rstrip("/") + self.get_page_url()
+        if self.is_at_url(url) and self.is_page_healthy():
+            self.logger.info(f"Soft resetting page at: {url}")
+            self.reset_page_state()
+            BasePage.navigation_stats["soft_resets"] += 1
+            return
+        self.navigate_to(url)
+        BasePage.navigation_stats["full_navigations"] += 1
+    
+    def is_at_url(self, url: str) -> bool:
+        """Check if the browser is already on the given URL, ignoring query and fragment"""
+        current, expected = urlparse(self.page.url), urlparse(url)
+        return (current.netloc == expected.netloc
+                and (current.path.rstrip("/") or "/") == (expected.path.rstrip("/") or "/"))
+    
+    def is_page_healthy(self) -> bool:
+        """Cheap probe that the page finished loading and shows its expected content"""
+        try:
+            return self.page.evaluate("document.readyState") == "complete" and self.is_page_loaded()
+        except Exception:
+            return False
+    
+    def reset_page_state(self) -> None:
+        """Clear cookies, form inputs and web storage without reloading the page"""
+        self.page.context.clear_cookies()
+        self.page.evaluate(RESET_PAGE_STATE_JS)
+    
+    @classmethod
+    def get_navigation_stats(cls) -> Dict[str, int]:
+        """Get the number of full navigations and soft resets (navigations saved)"""
+        return dict(BasePage.navigation_stats)
+    
     def wait_for_page_load(self, timeout: int = 30000) -> None:
         """Wait for the page to load completely"""
         self.page.wait_for_load_state("networkidle", timeout=timeout)
@@ -37,40 +97,51 @@ class BasePage(ABC):
         """Get the current URL"""
         return self.page.url
     
+    def profile_selector(self, selector: str) -> ContextManager:
+        """Record resolution time and match count of a selector in profiling mode"""
+        return SelectorProfiler.measure(self.page, selector, source=self.__class__.__name__)
+    
     def wait_for_element(self, selector: str, timeout: int = 30000) -> None:
         """Wait for an element to be visible"""
-        self.page.wait_for_selector(selector, timeout=timeout)
+        with self.profile_selector(selector):
+            self.page.wait_for_selector(selector, timeout=timeout)
     
     def click_element(self, selector: str) -> None:
         """Click an element"""
         self.logger.info(f"Clicking element: {selector}")
-        self.page.click(selector)
+        with self.profile_selector(selector):
+            self.page.click(selector)
     
     def fill_input(self, selector: str, value: str) -> None:
         """Fill an input field"""
         self.logger.info(f"Filling input {selector} with value: {value}")
-        self.page.fill(selector, value)
+        with self.profile_selector(selector):
+            self.page.fill(selector, value)
     
     def get_text(self, selector: str) -> str:
         """Get text content of an element"""
-        return self.page.locator(selector).text_content() or ""
+        with self.profile_selector(selector):
+            return self.page.locator(selector).text_content() or ""
     
     def is_element_visible(self, selector: str) -> bool:
         """Check if an element is visible"""
         try:
-            return self.page.locator(selector).is_visible()
+            with self.profile_selector(selector):
+                return self.page.locator(selector).is_visible()
         except Exception:
             return False
     
     def wait_for_text(self, text: str, timeout: int = 30000) -> None:
         """Wait for specific text to appear on the page"""
         self.logger.info(f"Waiting for text: {text}")
-        self.page.wait_for_selector(f"text={text}", timeout=timeout)
+        with self.profile_selector(f"text={text}"):
+            self.page.wait_for_selector(f"text={text}", timeout=timeout)
     
     def verify_text_present(self, text: str) -> bool:
         """Verify if specific text is present on the page"""
         try:
-            expect(self.page.locator(f"text={text}")).to_be_visible()
+            with self.profile_selector(f"text={text}"):
+                expect(self.page.locator(f"text={text}")).to_be_visible()
             return True
         except AssertionError:
             self.logger.error(f"Text '{text}' not found on page")
@@ -81,4 +152,35 @@ class BasePage(ABC):
         screenshot_path = f"reports/screenshots/{name}.png"
         self.page.screenshot(path=screenshot_path)
         self.logger.info(f"Screenshot saved: {screenshot_path}")
-        return screenshot_path
\ No newline at end of file
+        return screenshot_path
+    
+    def get_element_regions(self, selectors: Sequence[str]) -> List[Region]:
+        """Get the (x, y, width, height) screenshot-pixel boxes of all matching elements"""
+        # Bounding boxes are in CSS pixels, screenshots in device pixels
+        scale = self.page.evaluate("window.devicePixelRatio") or 1
+        regions = []
+        for selector in selectors:
+            for element in self.page.locator(selector).all():
+                box = element.bounding_box()
+                if box:
+                    regions.append((box["x"] * scale, box["y"] * scale,
+                                    box["width"] * scale, box["height"] * scale))
+        return regions
+    
+    def build_visual_request(self, name: str, ignore_selectors: Sequence[str] = (),
+                             ignore_regions: Sequence[Region] = ()) -> ComparisonRequest:
+        """Take a uniquely named screenshot and describe its comparison with this page's baseline"""
+        screenshot_name = Path(ScreenshotHelper.generate_screenshot_name(name)).stem
+        return ComparisonRequest(
+            page_name=self.__class__.__name__,
+            name=name,
+            actual_path=self.take_screenshot(screenshot_name),
+            viewport=self.page.viewport_size,
+            ignore_regions=list(ignore_regions) + self.get_element_regions(ignore_selectors)
+        )
+    
+    def compare_with_baseline(self, name: str, comparator: VisualComparator,
+                              ignore_selectors: Sequence[str] = (),
+                              ignore_regions: Sequence[Region] = ()) -> ComparisonResult:
+        """Take a screenshot and compare it with the stored baseline for this page right away"""
+        return comparator.compare(self.build_visual_request(name, ignore_selectors, ignore_regions))
\ No newline at end of file
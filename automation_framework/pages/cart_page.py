@@ -28,16 +28,18 @@ class CartPage(BasePage):
     
     def get_cart_items_count(self) -> int:
         """Get the number of items in cart"""
-        return len(self.page.locator(self.CART_ITEMS).all())
+        with self.profile_selector(self.CART_ITEMS):
+            return len(self.page.locator(self.CART_ITEMS).all())
     
     def get_cart_item_names(self) -> list:
         """Get list of all cart item names"""
         item_names = []
-        items = self.page.locator(self.CART_ITEM_NAMES).all()
-        for item in items:
-            name = item.text_content()
-            if name:
-                item_names.append(name)
+        with self.profile_selector(self.CART_ITEM_NAMES):
+            items = self.page.locator(self.CART_ITEM_NAMES).all()
+            for item in items:
+                name = item.text_content()
+                if name:
+                    item_names.append(name)
         return item_names
     
     def verify_item_in_cart(self, item_name: str) -> bool:
@@ -55,8 +57,9 @@ class CartPage(BasePage):
     
     def remove_first_item(self) -> None:
         """Remove the first item from cart"""
-        first_remove_button = self.page.locator(self.REMOVE_BUTTONS).first
-        first_remove_button.click()
+        with self.profile_selector(self.REMOVE_BUTTONS):
+            first_remove_button = self.page.locator(self.REMOVE_BUTTONS).first
+            first_remove_button.click()
     
     def is_cart_empty(self) -> bool:
         """Check if cart is empty"""
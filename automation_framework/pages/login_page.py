@@ -9,6 +9,7 @@ class LoginPage(BasePage):
     PASSWORD_INPUT = '[data-test="password"]'
     LOGIN_BUTTON = '[data-test="login-button"]'
     ERROR_MESSAGE = '[data-test="error"]'
+    ERROR_CLOSE_BUTTON = '.error-button'
     LOGIN_LOGO = '.login_logo'
     
     def __init__(self, page: Page):
@@ -21,6 +22,12 @@ class LoginPage(BasePage):
         """Check if login page is loaded"""
         return self.is_element_visible(self.LOGIN_LOGO) and self.is_element_visible(self.LOGIN_BUTTON)
     
+    def reset_page_state(self) -> None:
+        """Clear the login form and dismiss any error message"""
+        super().reset_page_state()
+        if self.is_element_visible(self.ERROR_CLOSE_BUTTON):
+            self.click_element(self.ERROR_CLOSE_BUTTON)
+    
     def enter_username(self, username: str) -> None:
         """Enter username in the username field"""
         self.fill_input(self.USERNAME_INPUT, username)
@@ -32,12 +32,14 @@ class ProductsPage(BasePage):
     
     def get_products_count(self) -> int:
         """Get the number of products displayed"""
-        return len(self.page.locator(self.INVENTORY_ITEMS).all())
+        with self.profile_selector(self.INVENTORY_ITEMS):
+            return len(self.page.locator(self.INVENTORY_ITEMS).all())
     
     def add_first_product_to_cart(self) -> None:
         """Add the first product to cart"""
-        first_add_button = self.page.locator(self.ADD_TO_CART_BUTTONS).first
-        first_add_button.click()
+        with self.profile_selector(self.ADD_TO_CART_BUTTONS):
+            first_add_button = self.page.locator(self.ADD_TO_CART_BUTTONS).first
+            first_add_button.click()
     
     def click_shopping_cart(self) -> None:
         """Click the shopping cart icon"""
@@ -45,16 +47,18 @@ class ProductsPage(BasePage):
     
     def sort_products_by_name_a_to_z(self) -> None:
         """Sort products by name A to Z"""
-        self.page.select_option(self.SORT_DROPDOWN, "az")
+        with self.profile_selector(self.SORT_DROPDOWN):
+            self.page.select_option(self.SORT_DROPDOWN, "az")
     
     def get_product_names(self) -> list:
         """Get list of all product names"""
         product_names = []
-        products = self.page.locator(self.INVENTORY_ITEMS).all()
-        for product in products:
-            name = product.locator('.inventory_item_name').text_content()
-            if name:
-                product_names.append(name)
+        with self.profile_selector(self.INVENTORY_ITEMS):
+            products = self.page.locator(self.INVENTORY_ITEMS).all()
+            for product in products:
+                name = product.locator('.inventory_item_name').text_content()
+                if name:
+                    product_names.append(name)
         return product_names
     
     def verify_products_sorted_a_to_z(self) -> bool:
@@ -22,6 +22,8 @@ def run_command(command, description):
             print(result.stdout)
     else:
         print(f"❌ {description} failed")
+        if result.stdout:
+            print(result.stdout)
         print(f"Error: {result.stderr}")
         return False
     return True
@@ -58,6 +60,18 @@ def run_tests(args):
     if args.test:
         cmd_parts.append(f"-k {args.test}")
     
+    # Retry failed tests in the same session
+    if args.retries:
+        cmd_parts.append(f"--retry-failed={args.retries}")
+    
+    # Enable selector profiling
+    if args.profile_selectors:
+        os.environ["PROFILE_SELECTORS"] = "true"
+    
+    # Enable resource monitoring
+    if args.monitor_resources:
+        os.environ["MONITOR_RESOURCES"] = "true"
+    
     # Add reporting
     cmd_parts.append("--html=reports/report.html --self-contained-html")
     cmd_parts.append("--alluredir=reports/allure-results")
@@ -69,6 +83,19 @@ def run_tests(args):
     command = " ".join(cmd_parts)
     return run_command(command, f"Running tests with command: {command}")
 
+def run_benchmarks(args):
+    """Run page object benchmarks and compare them with the stored baseline"""
+    cmd_parts = ["python -m benchmarks.page_object_benchmarks"]
+    
+    if args.benchmark_threshold is not None:
+        cmd_parts.append(f"--threshold={args.benchmark_threshold}")
+    
+    if args.save_baseline:
+        cmd_parts.append("--save-baseline")
+    
+    command = " ".join(cmd_parts)
+    return run_command(command, "Running page object benchmarks")
+
 def generate_allure_report():
     """Generate and serve Allure report"""
     if not Path("reports/allure-results").exists():
@@ -98,8 +125,22 @@ def main():
     parser.add_argument("--test", help="Specific test to run (e.g., TC_AUTH_01)")
     parser.add_argument("--verbose", action="store_true", help="Verbose output")
     parser.add_argument("--report", action="store_true", help="Generate Allure report")
+    parser.add_argument("--retries", type=int,
+                        help="Retry failed tests at the end of the session (e.g., 2)")
+    parser.add_argument("--profile-selectors", action="store_true",
+                        help="Profile selector resolution times")
+    parser.add_argument("--monitor-resources", action="store_true",
+                        help="Track CPU and memory per test")
+    parser.add_argument("--benchmark", action="store_true", help="Run page object benchmarks")
+    parser.add_argument("--benchmark-threshold", type=float,
+                        help="Allowed slowdown over baseline (e.g., 0.2)")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="Save benchmark results as the new baseline")
     
     args = parser.parse_args()
+    if args.parallel and args.retries:
+        parser.error("--retries cannot be combined with --parallel, "
+                     "failed tests are only retried in a single process")
     
     # Change to framework directory
     framework_dir = Path(__file__).parent
@@ -127,6 +168,12 @@ def main():
         generate_allure_report()
         return
     
+    # Run benchmarks
+    if args.benchmark:
+        if not run_benchmarks(args):
+            sys.exit(1)
+        return
+    
     # Run tests
     if not run_tests(args):
         sys.exit(1)
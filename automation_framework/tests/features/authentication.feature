@@ -18,4 +18,12 @@ Feature: Authentication Module
     When user enters user name as "standard_use" and password as "secret_sauce"
     And click Login Button
     Then verify page has text "Login"
-    And Login Button should be still displayed
\ No newline at end of file
+    And Login Button should be still displayed
+
+  @auth @regression @TC_AUTH_03
+  Scenario: TC_AUTH_03 - Products page matches its visual baseline after login
+    When user enters user name as "standard_user" and password as "secret_sauce"
+    And click Login Button
+    Then verify page has text "Products"
+    And page should match visual baseline "products"
+    And page should match visual baseline "products_header" ignoring ".inventory_list, .footer"
@@ -1,8 +1,14 @@
 import pytest
+from urllib.parse import urlparse
 from pytest_bdd import scenarios, given, when, then, parsers
 from playwright.sync_api import Page, expect
+from pages.base_page import BasePage
+from pages.cart_page import CartPage
 from pages.login_page import LoginPage
+from pages.products_page import ProductsPage
 from utils.logger import Logger
+from utils.selector_profiler import SelectorProfiler
+from utils.visual_regression import VisualComparator
 
 # Load scenarios from authentication feature file only
 scenarios("../features/authentication.feature")
@@ -14,9 +20,17 @@ logger = Logger.get_logger("steps")
 def login_page(page: Page, base_url: str):
     """Login page fixture"""
     login_page = LoginPage(page)
-    page.goto(base_url)
+    login_page.open(base_url)
     return login_page
 
+def get_current_page_object(page: Page) -> BasePage:
+    """Return the page object matching the page's current URL"""
+    path = urlparse(page.url).path or "/"
+    for page_class in (ProductsPage, CartPage):
+        if path.endswith(page_class(page).get_page_url()):
+            return page_class(page)
+    return LoginPage(page)
+
 # Step definitions for Authentication Module only (TC_AUTH_01 and TC_AUTH_02)
 @given("user is on Login Page")
 def user_is_on_login_page(login_page: LoginPage):
@@ -41,10 +55,35 @@ def click_login_button(login_page: LoginPage):
 def verify_page_has_text(page: Page, text: str):
     """Verify specific text is present on the page"""
     logger.info(f"Verifying page has text: {text}")
-    expect(page.locator(f"text={text}")).to_be_visible()
+    with SelectorProfiler.measure(page, f"text={text}", source="steps"):
+        expect(page.locator(f"text={text}")).to_be_visible()
 
 @then("Login Button should be still displayed")
 def login_button_still_displayed(login_page: LoginPage):
     """Verify login button is still displayed"""
     logger.info("Verifying Login Button is still displayed")
-    assert login_page.is_login_button_visible(), "Login button should still be visible"
\ No newline at end of file
+    assert login_page.is_login_button_visible(), "Login button should still be visible"
+
+# Visual regression steps
+def assert_matches_visual_baseline(page: Page, visual_comparator: VisualComparator, name: str,
+                                   ignore_selectors: tuple = ()) -> None:
+    page_object = get_current_page_object(page)
+    result = page_object.compare_with_baseline(name, visual_comparator,
+                                               ignore_selectors=ignore_selectors)
+    assert result.passed, (f"Visual mismatch for {result.page_name}/{name}: {result.message} "
+                           f"(diff: {result.diff_path})")
+
+@then(parsers.re(r'page should match visual baseline "(?P<name>[^"]+)"$'))
+def page_matches_visual_baseline(page: Page, visual_comparator: VisualComparator, name: str):
+    """Compare the current page with its stored visual baseline"""
+    logger.info(f"Comparing page with visual baseline: {name}")
+    assert_matches_visual_baseline(page, visual_comparator, name)
+
+@then(parsers.re(r'page should match visual baseline "(?P<name>[^"]+)" '
+                 r'ignoring "(?P<selectors>[^"]+)"$'))
+def page_matches_visual_baseline_ignoring(page: Page, visual_comparator: VisualComparator,
+                                          name: str, selectors: str):
+    """Compare the current page with its visual baseline, masking comma-separated selectors"""
+    logger.info(f"Comparing page with visual baseline: {name} (ignoring {selectors})")
+    ignore_selectors = tuple(selector.strip() for selector in selectors.split(","))
+    assert_matches_visual_baseline(page, visual_comparator, name, ignore_selectors)
\ No newline at end of file
@@ -0,0 +1,17 @@
+import pytest
+
+
+# Unit tests run without a browser, so the page-based autouse fixtures are replaced
+@pytest.fixture(autouse=True)
+def profile_selectors():
+    yield
+
+
+@pytest.fixture(autouse=True)
+def take_screenshot_on_failure():
+    yield
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_page():
+    yield
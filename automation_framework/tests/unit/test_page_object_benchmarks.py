@@ -0,0 +1,33 @@
+from benchmarks.page_object_benchmarks import compare_with_baseline, summarize
+
+
+def stats(median_ms: float) -> dict:
+    return {"median_ms": median_ms}
+
+
+def test_summarize_reports_order_statistics():
+    summary = summarize([5.0, 1.0, 3.0, 2.0, 4.0])
+
+    assert summary["rounds"] == 5
+    assert summary["min_ms"] == 1.0
+    assert summary["max_ms"] == 5.0
+    assert summary["median_ms"] == 3.0
+    assert summary["p95_ms"] == 5.0
+    assert summarize([2.0])["stdev_ms"] == 0.0
+
+
+def test_only_slowdowns_past_the_threshold_are_regressions():
+    baseline = {"fast": stats(10.0), "slightly_slower": stats(10.0), "much_slower": stats(10.0)}
+    results = {"fast": stats(8.0), "slightly_slower": stats(11.9), "much_slower": stats(12.5)}
+
+    regressions = compare_with_baseline(results, baseline, threshold=0.2)
+
+    assert [regression["benchmark"] for regression in regressions] == ["much_slower"]
+    assert regressions[0]["change"] == 0.25
+
+
+def test_benchmarks_missing_from_the_baseline_are_skipped():
+    baseline = {"old": stats(10.0), "zero": stats(0.0)}
+    results = {"new": stats(50.0), "zero": stats(5.0)}
+
+    assert compare_with_baseline(results, baseline, threshold=0.2) == []
@@ -0,0 +1,26 @@
+import subprocess
+import sys
+import time
+
+import pytest
+
+from utils.resource_monitor import PROC_DIR, ProcessSampler
+
+pytestmark = pytest.mark.skipif(not PROC_DIR.exists(), reason="needs /proc")
+
+
+def test_child_cpu_is_kept_after_the_child_exits():
+    sampler = ProcessSampler()
+    start = sampler.take_sample()
+    child = subprocess.Popen([sys.executable, "-c", "while True: pass"])
+    try:
+        time.sleep(0.5)
+        running = sampler.take_sample()
+    finally:
+        child.kill()
+        child.wait()
+    finished = sampler.take_sample()
+
+    assert running.children_cpu > start.children_cpu
+    assert finished.children_cpu >= running.children_cpu
+    assert finished.children < running.children
@@ -0,0 +1,62 @@
+import json
+
+import jsonschema
+import pytest
+
+from utils.test_data_store import TestDataStore, UserAccount
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    """Point the store at an empty data directory"""
+    monkeypatch.setattr(TestDataStore, "DATA_DIR", tmp_path)
+    monkeypatch.setattr(TestDataStore, "SCHEMA_DIR", tmp_path / "schemas")
+    TestDataStore.clear_cache()
+    yield tmp_path
+    TestDataStore.clear_cache()
+
+
+def write_json(path, data) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data))
+
+
+def test_load_returns_a_copy_of_the_cached_data(data_dir):
+    write_json(data_dir / "settings.json", {"retries": [1, 2]})
+
+    TestDataStore.load("settings")["retries"].append(3)
+
+    assert TestDataStore.load("settings") == {"retries": [1, 2]}
+
+
+def test_model_dataset_without_records_list_is_rejected(data_dir):
+    write_json(data_dir / "users.json", {"user": {"username": "a", "password": "b"}})
+
+    with pytest.raises(ValueError, match="list of records"):
+        TestDataStore.load("users")
+
+
+def test_schema_validates_each_record_for_json_and_jsonl(data_dir):
+    write_json(data_dir / "schemas" / "items.schema.json", {"type": "object", "required": ["sku"]})
+    write_json(data_dir / "items.json", {"records": [{"sku": "a"}]})
+    (data_dir / "items.jsonl").write_text('{"sku": "b"}\n{"name": "no sku"}\n')
+
+    assert TestDataStore.load("items") == [{"sku": "a"}]
+    records = TestDataStore.iter_records("items.jsonl")
+    assert next(records) == {"sku": "b"}
+    with pytest.raises(jsonschema.ValidationError):
+        next(records)
+
+
+def test_find_record_looks_up_accounts_by_role(data_dir):
+    (data_dir / "users.jsonl").write_text(
+        '{"username": "standard_user", "password": "p"}\n'
+        '{"username": "locked_out_user", "password": "p", "role": "locked_out"}\n'
+    )
+
+    account = TestDataStore.find_record("users", role="locked_out")
+
+    assert isinstance(account, UserAccount)
+    assert account.username == "locked_out_user"
+    with pytest.raises(LookupError):
+        TestDataStore.find_record("users", role="visual")
@@ -0,0 +1,96 @@
+import numpy as np
+from PIL import Image
+
+from utils.visual_regression import build_ignore_mask, compare_images
+
+
+def save_image(path, pixels: np.ndarray) -> str:
+    Image.fromarray(pixels).save(path)
+    return str(path)
+
+
+def make_image(height: int = 64, width: int = 96) -> np.ndarray:
+    """Gradient image, so every tile has different content"""
+    rows, cols = np.mgrid[0:height, 0:width]
+    return np.stack([rows * 3 % 256, cols * 2 % 256, (rows + cols) % 256], axis=2).astype(np.uint8)
+
+
+def test_identical_images_pass_and_skip_all_tiles(tmp_path):
+    pixels = make_image()
+    baseline = save_image(tmp_path / "baseline.png", pixels)
+    actual = save_image(tmp_path / "actual.png", pixels)
+
+    stats = compare_images(baseline, actual, str(tmp_path / "diff.png"), tile_size=32)
+
+    assert stats["passed"]
+    assert stats["mismatched_pixels"] == 0
+    assert stats["tiles_total"] == 6
+    assert stats["tiles_skipped"] == 6
+    assert stats["diff_path"] is None
+
+
+def test_changed_block_is_counted_and_rendered(tmp_path):
+    pixels = make_image()
+    changed = pixels.copy()
+    changed[10:20, 40:50] = 255 - changed[10:20, 40:50]
+    baseline = save_image(tmp_path / "baseline.png", pixels)
+    actual = save_image(tmp_path / "actual.png", changed)
+
+    stats = compare_images(baseline, actual, str(tmp_path / "diff.png"), tile_size=32)
+
+    assert not stats["passed"]
+    assert stats["mismatched_pixels"] == 100
+    assert stats["tiles_skipped"] == 5
+    assert (tmp_path / "diff.png").exists()
+
+
+def test_tolerance_and_ignore_regions(tmp_path):
+    pixels = make_image()
+    changed = pixels.copy()
+    changed[0:8, 0:8] = np.clip(changed[0:8, 0:8].astype(int) + 3, 0, 255).astype(np.uint8)
+    changed[40:50, 60:70] = 255 - changed[40:50, 60:70]
+    baseline = save_image(tmp_path / "baseline.png", pixels)
+    actual = save_image(tmp_path / "actual.png", changed)
+
+    stats = compare_images(baseline, actual, str(tmp_path / "diff.png"), tolerance=3,
+                           ignore_regions=[(60, 40, 10, 10)], tile_size=32)
+
+    assert stats["passed"]
+    assert stats["mismatched_pixels"] == 0
+    assert stats["compared_pixels"] == 64 * 96 - 100
+
+
+def test_size_mismatch_fails(tmp_path):
+    baseline = save_image(tmp_path / "baseline.png", make_image(64, 96))
+    actual = save_image(tmp_path / "actual.png", make_image(64, 80))
+
+    stats = compare_images(baseline, actual, str(tmp_path / "diff.png"))
+
+    assert not stats["passed"]
+    assert "Size mismatch" in stats["message"]
+
+
+def test_build_ignore_mask_clips_regions_to_the_image():
+    mask = build_ignore_mask((10, 20), [(15, -5, 10, 8), (0, 0, 0, 5)])
+
+    assert not mask[0:3, 15:20].any()
+    assert mask[3:, :].all()
+    assert mask[:, :15].all()
+
+
+def test_cached_tile_digests_are_recomputed_when_the_baseline_changes(tmp_path):
+    pixels = make_image()
+    replaced = pixels.copy()
+    replaced[0:32, 0:32] = 0
+    baseline_path = tmp_path / "baseline.png"
+    baseline = save_image(baseline_path, pixels)
+    actual = save_image(tmp_path / "actual.png", pixels)
+    assert compare_images(baseline, actual, str(tmp_path / "diff.png"))["passed"]
+    assert (tmp_path / "baseline.tiles.json").exists()
+
+    # Stale digests of the old baseline would match the actual image and skip every tile
+    save_image(baseline_path, replaced)
+    stats = compare_images(baseline, actual, str(tmp_path / "diff.png"))
+
+    assert not stats["passed"]
+    assert stats["tiles_skipped"] == 5
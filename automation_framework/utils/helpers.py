@@ -2,21 +2,19 @@ import json
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List, Union
+from utils.test_data_store import TestDataStore
 
 class TestDataHelper:
     """Helper class for test data management"""
     
     @staticmethod
-    def load_test_data(file_name: str) -> Dict[str, Any]:
-        """Load test data from JSON file"""
-        data_dir = Path("tests/test_data")
-        file_path = data_dir / file_name
-        
-        if file_path.exists():
-            with open(file_path, 'r') as f:
-                return json.load(f)
-        return {}
+    def load_test_data(file_name: str) -> Union[Dict[str, Any], List[Any]]:
+        """Load test data from JSON file, cached and validated by TestDataStore.
+
+        Datasets with a schema or registered model come back as a list of validated records.
+        """
+        return TestDataStore.load(file_name)
     
     @staticmethod
     def save_test_results(test_name: str, results: Dict[str, Any]) -> None:
@@ -0,0 +1,303 @@
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from config.config import Config
+from utils.logger import Logger
+
+logger = Logger.get_logger("resource_monitor")
+
+PROC_DIR = Path("/proc")
+
+
+def _read_stat(pid: int) -> Optional[Tuple[int, int]]:
+    """Return (parent pid, cpu ticks) of a process, or None if it has exited"""
+    try:
+        with open(PROC_DIR / str(pid) / "stat", 'r') as f:
+            stat = f.read()
+    except OSError:
+        return None
+    # The command name may contain spaces, so split after its closing bracket
+    fields = stat[stat.rindex(")") + 2:].split()
+    return int(fields[1]), int(fields[11]) + int(fields[12])
+
+
+def _read_rss(pid: int) -> int:
+    """Return the resident set size of a process in bytes"""
+    try:
+        with open(PROC_DIR / str(pid) / "statm", 'r') as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, IndexError, ValueError):
+        return 0
+
+
+class ProcessSample:
+    """CPU time and memory of the worker process and its descendants at one instant"""
+
+    def __init__(self, worker_cpu: float, worker_rss: int, children_cpu: float, children_rss: int,
+                 children: int):
+        self.timestamp = time.monotonic()
+        self.worker_cpu = worker_cpu
+        self.worker_rss = worker_rss
+        self.children_cpu = children_cpu
+        self.children_rss = children_rss
+        self.children = children
+
+    @property
+    def total_rss(self) -> int:
+        return self.worker_rss + self.children_rss
+
+    @property
+    def total_cpu(self) -> float:
+        return self.worker_cpu + self.children_cpu
+
+
+class ProcessSampler(threading.Thread):
+    """Background thread that samples the worker process tree from /proc"""
+
+    def __init__(self, interval: float = 0.2, pid: Optional[int] = None):
+        super().__init__(name="resource-sampler", daemon=True)
+        self.interval = interval
+        self.pid = pid or os.getpid()
+        self.clock_ticks = os.sysconf("SC_CLK_TCK")
+        self.peak_rss = 0
+        self.latest: Optional[ProcessSample] = None
+        # Last seen CPU ticks of each descendant, and the final ticks of descendants that exited
+        self._last_ticks: Dict[int, int] = {}
+        self._exited_ticks = 0
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+
+    def _get_descendants(self) -> List[int]:
+        parents: Dict[int, List[int]] = {}
+        for entry in PROC_DIR.iterdir():
+            if entry.name.isdigit():
+                stat = _read_stat(int(entry.name))
+                if stat:
+                    parents.setdefault(stat[0], []).append(int(entry.name))
+
+        descendants = []
+        queue = [self.pid]
+        while queue:
+            children = parents.get(queue.pop(), [])
+            descendants.extend(children)
+            queue.extend(children)
+        return descendants
+
+    def take_sample(self) -> ProcessSample:
+        """Read the current CPU time and RSS of the worker and all its child processes.
+
+        Child CPU time includes the last seen ticks of children that have exited since, so it
+        never goes down when a browser process ends.
+        """
+        with self._lock:
+            worker_stat = _read_stat(self.pid)
+            ticks: Dict[int, int] = {}
+            children_rss = 0
+            descendants = self._get_descendants()
+            for pid in descendants:
+                stat = _read_stat(pid)
+                if stat:
+                    ticks[pid] = stat[1]
+                    children_rss += _read_rss(pid)
+
+            for pid, last_ticks in self._last_ticks.items():
+                # A lower count under the same pid means the pid was reused by a new process
+                if pid not in ticks or ticks[pid] < last_ticks:
+                    self._exited_ticks += last_ticks
+            self._last_ticks = ticks
+
+            sample = ProcessSample(
+                worker_cpu=(worker_stat[1] if worker_stat else 0) / self.clock_ticks,
+                worker_rss=_read_rss(self.pid),
+                children_cpu=(sum(ticks.values()) + self._exited_ticks) / self.clock_ticks,
+                children_rss=children_rss,
+                children=len(descendants),
+            )
+            self.latest = sample
+            self.peak_rss = max(self.peak_rss, sample.total_rss)
+        return sample
+
+    def reset_peak(self) -> ProcessSample:
+        """Take a fresh sample and restart peak tracking from it"""
+        sample = self.take_sample()
+        with self._lock:
+            self.peak_rss = sample.total_rss
+        return sample
+
+    def run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            try:
+                self.take_sample()
+            except Exception as error:
+                logger.error(f"Resource sampling failed: {error}")
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self.join(timeout=self.interval * 5)
+
+
+class ResourceMonitor:
+    """Per-test resource usage and browser context/page leak tracking"""
+
+    _sampler: Optional[ProcessSampler] = None
+    _enabled: Optional[bool] = None
+    _browser = None
+    _shared_context = None
+    _test_start: Optional[ProcessSample] = None
+    _contexts_at_start = 0
+    _records: List[Dict[str, Any]] = []
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        """Check if resource monitoring is switched on and supported on this platform"""
+        if cls._enabled is None:
+            enabled = Config.get_monitoring_config().get("resources", False)
+            cls._enabled = enabled and PROC_DIR.exists()
+        return cls._enabled
+
+    @classmethod
+    def start(cls) -> None:
+        """Start the background sampler"""
+        if not cls.is_enabled() or cls._sampler:
+            return
+        cls._sampler = ProcessSampler(interval=Config.get_monitoring_config().get("interval", 0.2))
+        cls._sampler.take_sample()
+        cls._sampler.start()
+        logger.info(f"Resource monitoring started for pid {cls._sampler.pid}")
+
+    @classmethod
+    def stop(cls) -> None:
+        """Stop the background sampler"""
+        if cls._sampler:
+            cls._sampler.stop()
+            cls._sampler = None
+
+    @classmethod
+    def register_browser(cls, browser) -> None:
+        """Count the open contexts and pages of this browser, whoever created them"""
+        cls._browser = browser
+
+    @classmethod
+    def unregister_browser(cls) -> None:
+        cls._browser = None
+
+    @classmethod
+    def set_shared_context(cls, context) -> None:
+        """Exclude the context kept open on purpose by page reuse from the leak count"""
+        cls._shared_context = context
+
+    @classmethod
+    def _count_unshared_contexts(cls) -> int:
+        if not cls._browser or not cls._browser.is_connected():
+            return 0
+        return sum(1 for context in cls._browser.contexts if context is not cls._shared_context)
+
+    @classmethod
+    def get_open_counts(cls) -> Tuple[int, int]:
+        """Return (open contexts, open pages) of the registered browser"""
+        if not cls._browser or not cls._browser.is_connected():
+            return 0, 0
+        contexts = cls._browser.contexts
+        return len(contexts), sum(len(context.pages) for context in contexts)
+
+    @classmethod
+    def start_test(cls) -> None:
+        """Mark the beginning of a test"""
+        if not cls._sampler:
+            return
+        cls._test_start = cls._sampler.reset_peak()
+        cls._contexts_at_start = cls._count_unshared_contexts()
+
+    @classmethod
+    def finish_test(cls, nodeid: str) -> Optional[Dict[str, Any]]:
+        """Record usage of the test that just finished, including teardown"""
+        if not cls._sampler or not cls._test_start:
+            return None
+
+        start = cls._test_start
+        end = cls._sampler.take_sample()
+        open_contexts, open_pages = cls.get_open_counts()
+        leaked_contexts = max(cls._count_unshared_contexts() - cls._contexts_at_start, 0)
+        record = {
+            "test": nodeid,
+            "duration": round(end.timestamp - start.timestamp, 3),
+            "worker_cpu": round(end.worker_cpu - start.worker_cpu, 3),
+            "browser_cpu": round(end.children_cpu - start.children_cpu, 3),
+            "peak_rss_mb": round(cls._sampler.peak_rss / 2 ** 20, 1),
+            "rss_mb": round(end.total_rss / 2 ** 20, 1),
+            "rss_delta_mb": round((end.total_rss - start.total_rss) / 2 ** 20, 1),
+            "worker_rss_delta_mb": round((end.worker_rss - start.worker_rss) / 2 ** 20, 1),
+            "browser_rss_delta_mb": round((end.children_rss - start.children_rss) / 2 ** 20, 1),
+            "child_processes": end.children,
+            "open_contexts": open_contexts,
+            "open_pages": open_pages,
+            "leaked_contexts": leaked_contexts,
+        }
+        cls._records.append(record)
+        cls._test_start = None
+
+        if leaked_contexts:
+            logger.warning(f"{nodeid} left {leaked_contexts} browser context(s) open")
+        return record
+
+    @classmethod
+    def get_records(cls) -> List[Dict[str, Any]]:
+        return list(cls._records)
+
+    @classmethod
+    def detect_memory_growth(cls) -> Optional[float]:
+        """Return the RSS growth in MB per test if memory grows steadily over the session"""
+        monitoring_config = Config.get_monitoring_config()
+        min_tests = monitoring_config.get("min_tests", 5)
+        threshold = monitoring_config.get("growth_threshold_mb", 2.0)
+        series = [record["rss_mb"] for record in cls._records]
+        if len(series) < max(min_tests, 2):
+            return None
+
+        # Least-squares slope of end-of-test RSS against test index
+        count = len(series)
+        mean_x = (count - 1) / 2
+        mean_y = sum(series) / count
+        slope = (sum((index - mean_x) * (value - mean_y) for index, value in enumerate(series))
+                 / sum((index - mean_x) ** 2 for index in range(count)))
+        rising_steps = sum(1 for previous, current in zip(series, series[1:]) if current > previous)
+
+        if slope >= threshold and rising_steps / (count - 1) >= 0.6:
+            return slope
+        return None
+
+    @classmethod
+    def format_table(cls) -> List[str]:
+        """Format the per-test resource table"""
+        lines = [f"{'test':<60} {'time s':>7} {'cpu s':>7} {'brw cpu':>7} {'peak MB':>8} "
+                 f"{'delta MB':>8} {'ctx':>4} {'pages':>5} {'leaks':>5}"]
+        for record in cls._records:
+            lines.append(
+                f"{record['test'][-60:]:<60} {record['duration']:>7.2f} "
+                f"{record['worker_cpu']:>7.2f} {record['browser_cpu']:>7.2f} "
+                f"{record['peak_rss_mb']:>8.1f} {record['rss_delta_mb']:>8.1f} "
+                f"{record['open_contexts']:>4} {record['open_pages']:>5} "
+                f"{record['leaked_contexts']:>5}"
+            )
+        return lines
+
+    @classmethod
+    def write_report(cls, report_path: Optional[str] = None) -> Optional[Path]:
+        """Save the per-test resource records"""
+        if not cls._records:
+            return None
+
+        worker = os.getenv("PYTEST_XDIST_WORKER")
+        path = Path(report_path or f"reports/resource_usage{f'_{worker}' if worker else ''}.json")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump({
+                "memory_growth_mb_per_test": cls.detect_memory_growth(),
+                "tests": cls._records,
+            }, f, indent=2)
+        logger.info(f"Resource usage report saved: {path}")
+        return path
@@ -0,0 +1,275 @@
+import json
+import os
+import statistics
+import time
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import Any, ContextManager, Dict, Iterator, List, Optional
+from urllib.parse import urlparse
+
+from config.config import Config
+from utils.logger import Logger
+
+logger = Logger.get_logger("selector_profiler")
+
+# Grows the catalogue to ``size`` items by cloning existing ones; clones are tagged for cleanup
+INFLATE_CATALOGUE_JS = """([selector, size]) => {
+    const items = Array.from(document.querySelectorAll(selector));
+    if (!items.length) return 0;
+    const parent = items[0].parentElement;
+    for (let i = items.length; i < size; i++) {
+        const clone = items[i % items.length].cloneNode(true);
+        clone.setAttribute('data-profiler-clone', '');
+        parent.appendChild(clone);
+    }
+    return document.querySelectorAll(selector).length;
+}"""
+
+REMOVE_CLONES_JS = """() => {
+    document.querySelectorAll('[data-profiler-clone]').forEach(el => el.remove());
+}"""
+
+# Describes the nearest element attributes that make a cheaper selector
+DESCRIBE_ELEMENT_JS = """el => {
+    const tagged = el.closest('[data-test]');
+    return {
+        id: el.id || null,
+        dataTest: el.getAttribute('data-test'),
+        ancestorDataTest: tagged && tagged !== el ? tagged.getAttribute('data-test') : null
+    };
+}"""
+
+
+class SelectorStats:
+    """Resolution statistics collected for one selector"""
+
+    def __init__(self, selector: str):
+        self.selector = selector
+        self.engine = SelectorProfiler.get_engine(selector)
+        self.durations_ms: List[float] = []
+        self.match_count = 0
+        self.sources = set()
+        self.paths = set()
+        self.benchmark_ms: Dict[int, float] = {}
+        self.suggestion: Optional[str] = None
+
+    @property
+    def total_ms(self) -> float:
+        return sum(self.durations_ms)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "selector": self.selector,
+            "engine": self.engine,
+            "calls": len(self.durations_ms),
+            "total_ms": round(self.total_ms, 3),
+            "mean_ms": round(statistics.mean(self.durations_ms), 3) if self.durations_ms else 0.0,
+            "max_ms": round(max(self.durations_ms), 3) if self.durations_ms else 0.0,
+            "match_count": self.match_count,
+            "sources": sorted(self.sources),
+            "paths": sorted(self.paths),
+            "benchmark_ms": {str(size): round(ms, 3)
+                             for size, ms in sorted(self.benchmark_ms.items())},
+            "suggestion": self.suggestion,
+        }
+
+
+class SelectorProfiler:
+    """Records how long selectors take to resolve and benchmarks them against the live DOM"""
+
+    _stats: Dict[str, SelectorStats] = {}
+    # (selector, path) pairs already benchmarked
+    _benchmarked = set()
+    _enabled: Optional[bool] = None
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        """Check if selector profiling is switched on"""
+        if cls._enabled is None:
+            cls._enabled = Config.get_profiling_config().get("selectors", False)
+        return cls._enabled
+
+    @classmethod
+    def set_enabled(cls, enabled: bool) -> None:
+        cls._enabled = enabled
+
+    @classmethod
+    def reset(cls) -> None:
+        """Clear all recorded statistics"""
+        cls._stats = {}
+        cls._benchmarked = set()
+
+    @staticmethod
+    def get_engine(selector: str) -> str:
+        """Classify the selector engine used by Playwright"""
+        if selector.startswith("text=") or ":has-text(" in selector or ":text(" in selector:
+            return "text"
+        if selector.startswith(("xpath=", "//")):
+            return "xpath"
+        if "[data-test" in selector:
+            return "data-test"
+        if selector.startswith("#"):
+            return "id"
+        return "css"
+
+    @classmethod
+    def measure(cls, page, selector: str, source: str = "") -> ContextManager:
+        """Time the wrapped selector operation when profiling is enabled"""
+        if not cls.is_enabled():
+            return nullcontext()
+        return cls._measure(page, selector, source)
+
+    @classmethod
+    @contextmanager
+    def _measure(cls, page, selector: str, source: str) -> Iterator[None]:
+        # The selector belongs to the page it was resolved on, even if the action navigates away
+        url = page.url
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration_ms = (time.perf_counter() - start) * 1000
+            match_count = None
+            if page.url == url:
+                try:
+                    match_count = page.locator(selector).count()
+                except Exception:
+                    match_count = 0
+            cls.record(selector, duration_ms, match_count, source, urlparse(url).path or "/")
+
+    @classmethod
+    def record(cls, selector: str, duration_ms: float, match_count: Optional[int], source: str = "",
+               path: str = "/") -> None:
+        """Add one resolution sample for a selector, ``match_count`` is None if it was not taken"""
+        stats = cls._stats.setdefault(selector, SelectorStats(selector))
+        stats.durations_ms.append(duration_ms)
+        if match_count is not None:
+            stats.match_count = max(stats.match_count, match_count)
+        if source:
+            stats.sources.add(source)
+        stats.paths.add(path)
+
+    @classmethod
+    def _time_selector(cls, page, selector: str, repetitions: int) -> float:
+        samples = []
+        for _ in range(repetitions):
+            start = time.perf_counter()
+            page.locator(selector).count()
+            samples.append((time.perf_counter() - start) * 1000)
+        return statistics.median(samples)
+
+    @classmethod
+    def suggest_alternative(cls, page, selector: str) -> Optional[str]:
+        """Suggest a cheaper selector that matches as many elements as the original one.
+
+        Candidates are built from the attributes of the first match and only kept when
+        they match the same number of elements; text selectors keep their text condition.
+        """
+        stats = cls._stats.get(selector)
+        engine = stats.engine if stats else cls.get_engine(selector)
+        if engine in ("data-test", "id"):
+            return None
+
+        try:
+            match_count = page.locator(selector).count()
+            if not match_count:
+                return None
+            info = page.locator(selector).first.evaluate(DESCRIBE_ELEMENT_JS)
+        except Exception:
+            return None
+
+        own = [f'[data-test="{info["dataTest"]}"]' if info["dataTest"] else None,
+               f'#{info["id"]}' if info["id"] else None]
+        if engine == "text":
+            # A scope alone would drop the text condition, so it is kept after the scope
+            ancestor = (f'[data-test="{info["ancestorDataTest"]}"]'
+                        if info["ancestorDataTest"] else None)
+            candidates = [f"{scope} >> {selector}" for scope in own + [ancestor] if scope]
+        else:
+            candidates = [scope for scope in own if scope]
+
+        for candidate in candidates:
+            try:
+                if page.locator(candidate).count() == match_count:
+                    return candidate
+            except Exception:
+                continue
+        return None
+
+    @classmethod
+    def benchmark_page(cls, page, catalogue_sizes: Optional[List[int]] = None,
+                       repetitions: Optional[int] = None) -> None:
+        """Benchmark the selectors recorded for the current page at growing catalogue sizes"""
+        profiling_config = Config.get_profiling_config()
+        catalogue_sizes = catalogue_sizes or profiling_config.get("catalogue_sizes", [6, 60, 300])
+        repetitions = repetitions or profiling_config.get("repetitions", 5)
+        catalogue_selector = profiling_config.get("catalogue_selector", ".inventory_item")
+
+        path = urlparse(page.url).path or "/"
+        selectors = [stats for stats in cls._stats.values()
+                     if path in stats.paths and (stats.selector, path) not in cls._benchmarked]
+        if not selectors:
+            return
+
+        logger.info(f"Benchmarking {len(selectors)} selectors on {path}")
+        for stats in selectors:
+            if stats.suggestion is None:
+                stats.suggestion = cls.suggest_alternative(page, stats.selector)
+
+        try:
+            for size in sorted(catalogue_sizes):
+                actual_size = page.evaluate(INFLATE_CATALOGUE_JS, [catalogue_selector, size]) or 0
+                for stats in selectors:
+                    stats.benchmark_ms[actual_size] = cls._time_selector(page, stats.selector,
+                                                                         repetitions)
+                if not actual_size:
+                    # Page has no catalogue to grow, a single measurement is enough
+                    break
+        finally:
+            page.evaluate(REMOVE_CLONES_JS)
+            cls._benchmarked.update((stats.selector, path) for stats in selectors)
+
+    @classmethod
+    def benchmark_visited_pages(cls, page) -> None:
+        """Revisit every page seen by recorded selectors and benchmark it"""
+        current = urlparse(page.url)
+        pending = sorted({path for stats in cls._stats.values() for path in stats.paths
+                          if (stats.selector, path) not in cls._benchmarked})
+        for path in pending:
+            try:
+                if path != (urlparse(page.url).path or "/"):
+                    page.goto(f"{current.scheme}://{current.netloc}{path}")
+                cls.benchmark_page(page)
+            except Exception as error:
+                logger.error(f"Selector benchmark failed on {path}: {error}")
+                cls._benchmarked.update((stats.selector, path) for stats in cls._stats.values()
+                                        if path in stats.paths)
+
+    @classmethod
+    def get_slowest(cls, limit: int = 10) -> List[SelectorStats]:
+        """Return the selectors with the highest total resolution time"""
+        return sorted(cls._stats.values(), key=lambda stats: stats.total_ms, reverse=True)[:limit]
+
+    @classmethod
+    def write_report(cls, report_path: Optional[str] = None) -> Optional[Path]:
+        """Save selector statistics and log the slowest selectors"""
+        if not cls._stats:
+            return None
+
+        top = Config.get_profiling_config().get("report_top", 10)
+        worker = os.getenv("PYTEST_XDIST_WORKER")
+        path = Path(report_path or f"reports/selector_profile{f'_{worker}' if worker else ''}.json")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump({
+                "slowest": [stats.selector for stats in cls.get_slowest(top)],
+                "selectors": [stats.to_dict() for stats in cls.get_slowest(len(cls._stats))],
+            }, f, indent=2)
+
+        logger.info(f"Slowest selectors (top {top}):")
+        for stats in cls.get_slowest(top):
+            hint = f" -> try {stats.suggestion}" if stats.suggestion else ""
+            logger.info(f"  {stats.total_ms:9.1f} ms  {len(stats.durations_ms):4d} calls  "
+                        f"{stats.match_count:4d} matches  {stats.selector}{hint}")
+        logger.info(f"Selector profile saved: {path}")
+        return path
@@ -0,0 +1,203 @@
+import copy
+import json
+import mmap
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Type
+
+import jsonschema
+import yaml
+from pydantic import BaseModel
+
+from config.config import Config
+from utils.logger import Logger
+
+logger = Logger.get_logger("test_data")
+
+
+class UserAccount(BaseModel):
+    """A login account of the application under test.
+
+    Only ``standard`` accounts are interchangeable, the other roles are accounts with a
+    deliberate defect that tests look up by role.
+    """
+    username: str
+    password: str
+    role: str = "standard"
+    description: str = ""
+
+
+class TestDataStore:
+    """Loads test datasets once per process, validates them and splits records between workers"""
+
+    __test__ = False
+
+    DATA_DIR = Config.BASE_DIR / "tests" / "test_data"
+    SCHEMA_DIR = DATA_DIR / "schemas"
+
+    # Dataset name -> pydantic model used to validate each record
+    _models: Dict[str, Type[BaseModel]] = {"users": UserAccount}
+    _cache: Dict[str, Any] = {}
+    _worker_cache: Dict[Tuple[str, Optional[Callable]], List[Any]] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def register_model(cls, name: str, model: Type[BaseModel]) -> None:
+        """Validate records of a dataset with a pydantic model"""
+        cls._models[name] = model
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Forget all loaded datasets"""
+        with cls._lock:
+            cls._cache = {}
+            cls._worker_cache = {}
+
+    @staticmethod
+    def get_worker_info() -> Tuple[int, int]:
+        """Return (worker index, worker count) of this process, (0, 1) without xdist"""
+        worker = os.getenv("PYTEST_XDIST_WORKER", "gw0")
+        count = int(os.getenv("PYTEST_XDIST_WORKER_COUNT", "1"))
+        return int(worker.lstrip("gw") or 0), max(count, 1)
+
+    @classmethod
+    def get_path(cls, name: str) -> Path:
+        """Find the data file of a dataset by name, with or without extension"""
+        path = cls.DATA_DIR / name
+        if path.suffix and path.exists():
+            return path
+        for suffix in (".json", ".jsonl", ".yaml", ".yml"):
+            candidate = cls.DATA_DIR / f"{name}{suffix}"
+            if candidate.exists():
+                return candidate
+        raise FileNotFoundError(f"Test data '{name}' not found in {cls.DATA_DIR}")
+
+    @classmethod
+    def _get_schema(cls, name: str) -> Optional[Dict[str, Any]]:
+        schema_file = cls.SCHEMA_DIR / f"{name}.schema.json"
+        if not schema_file.exists():
+            return None
+        with open(schema_file, 'r') as f:
+            return json.load(f)
+
+    @staticmethod
+    def _get_records(path: Path, data: Any) -> List[Any]:
+        """Return the records of a dataset held as a list or as an object with a ``records`` list"""
+        records = data.get("records") if isinstance(data, dict) else data
+        if not isinstance(records, list):
+            raise ValueError(f"'{path.name}' must hold a list of records "
+                             f"or an object with a 'records' list")
+        return records
+
+    @classmethod
+    def _validate_record(cls, name: str, record: Any, schema: Optional[Dict[str, Any]]) -> Any:
+        if schema:
+            jsonschema.validate(record, schema)
+        model = cls._models.get(name)
+        if model:
+            return model.model_validate(record)
+        return record
+
+    @classmethod
+    def load(cls, name: str) -> Any:
+        """Load and validate a JSON or YAML dataset, parsing the file only once per process.
+
+        A dataset with a schema or a registered model is a list of records and is returned as
+        the list of validated records; a schema describes one record, as in ``iter_records()``.
+        Every call returns its own copy, so a test changing the data does not affect other tests.
+        """
+        if name in cls._cache:
+            return copy.deepcopy(cls._cache[name])
+
+        with cls._lock:
+            if name not in cls._cache:
+                path = cls.get_path(name)
+                if path.suffix == ".jsonl":
+                    raise ValueError(f"'{path.name}' is a JSONL dataset, "
+                                     f"stream it with iter_records()")
+
+                with open(path, 'r') as f:
+                    data = json.load(f) if path.suffix == ".json" else yaml.safe_load(f)
+
+                dataset = Path(name).stem
+                schema = cls._get_schema(dataset)
+                if schema or dataset in cls._models:
+                    data = [cls._validate_record(dataset, record, schema)
+                            for record in cls._get_records(path, data)]
+
+                cls._cache[name] = data
+                logger.info(f"Loaded test data: {path.name}")
+        return copy.deepcopy(cls._cache[name])
+
+    @classmethod
+    def iter_records(cls, name: str, worker_only: bool = False) -> Iterator[Any]:
+        """Stream the records of a JSONL dataset through a memory map, validating each one.
+
+        With ``worker_only`` only the records owned by this xdist worker are parsed.
+        """
+        path = cls.get_path(name)
+        dataset = Path(name).stem
+        schema = cls._get_schema(dataset)
+        worker_index, worker_count = cls.get_worker_info() if worker_only else (0, 1)
+
+        if path.stat().st_size == 0:
+            return
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            index = 0
+            for line in iter(data.readline, b""):
+                line = line.strip()
+                if not line:
+                    continue
+                if index % worker_count == worker_index:
+                    yield cls._validate_record(dataset, json.loads(line), schema)
+                index += 1
+
+    @classmethod
+    def get_worker_records(cls, name: str,
+                           predicate: Optional[Callable[[Any], bool]] = None) -> List[Any]:
+        """Return the records of a dataset that belong to this xdist worker.
+
+        Records are split round-robin by position, after filtering with ``predicate``,
+        so no two workers ever receive the same record.
+        """
+        key = (name, predicate)
+        if key in cls._worker_cache:
+            return copy.deepcopy(cls._worker_cache[key])
+
+        worker_index, worker_count = cls.get_worker_info()
+        streamed = cls.get_path(name).suffix == ".jsonl"
+        if streamed and predicate is None:
+            # Lines owned by other workers are skipped without being parsed
+            owned = list(cls.iter_records(name, worker_only=True))
+        else:
+            records = cls.iter_records(name) if streamed else cls.load(name)
+            if predicate:
+                records = (record for record in records if predicate(record))
+            owned = [record for index, record in enumerate(records)
+                     if index % worker_count == worker_index]
+
+        with cls._lock:
+            cls._worker_cache[key] = owned
+        return copy.deepcopy(owned)
+
+    @classmethod
+    def get_worker_record(cls, name: str, predicate: Optional[Callable[[Any], bool]] = None) -> Any:
+        """Return the first record of a dataset owned by this xdist worker"""
+        records = cls.get_worker_records(name, predicate)
+        if not records:
+            worker_index, worker_count = cls.get_worker_info()
+            raise LookupError(f"No '{name}' record left for worker {worker_index} "
+                              f"of {worker_count}, add more records or run fewer workers")
+        return records[0]
+
+    @classmethod
+    def find_record(cls, name: str, **fields: Any) -> Any:
+        """Return the first record of a dataset whose fields have the given values, on any worker"""
+        streamed = cls.get_path(name).suffix == ".jsonl"
+        records = cls.iter_records(name) if streamed else cls.load(name)
+        for record in records:
+            values = record if isinstance(record, dict) else record.model_dump()
+            if all(values.get(field) == value for field, value in fields.items()):
+                return record
+        raise LookupError(f"No '{name}' record with {fields}")
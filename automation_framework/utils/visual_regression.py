@@ -0,0 +1,323 @@
+import hashlib
+import json
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from PIL import Image
+
+from config.config import Config
+from utils.logger import Logger
+
+logger = Logger.get_logger("visual")
+
+# Ignore regions are (x, y, width, height) rectangles in screenshot pixels
+Region = Tuple[int, int, int, int]
+
+
+@dataclass
+class ComparisonRequest:
+    """A single screenshot to compare against its stored baseline"""
+    page_name: str
+    name: str
+    actual_path: str
+    viewport: Dict[str, int]
+    ignore_regions: List[Region] = field(default_factory=list)
+
+
+@dataclass
+class ComparisonResult:
+    """Outcome and timing statistics of a baseline comparison"""
+    page_name: str
+    name: str
+    baseline_path: str
+    actual_path: str
+    passed: bool
+    diff_path: Optional[str] = None
+    new_baseline: bool = False
+    mismatched_pixels: int = 0
+    compared_pixels: int = 0
+    mismatch_ratio: float = 0.0
+    tiles_total: int = 0
+    tiles_skipped: int = 0
+    duration_ms: float = 0.0
+    message: str = ""
+
+
+def _load_rgb(path: Path) -> np.ndarray:
+    """Load an image as an (height, width, 3) uint8 array"""
+    with Image.open(path) as image:
+        return np.asarray(image.convert("RGB"), dtype=np.uint8)
+
+
+def _tile_grid(shape: Tuple[int, int], tile_size: int) -> Tuple[int, int]:
+    """Return the number of tile rows and columns covering an image"""
+    height, width = shape
+    return -(-height // tile_size), -(-width // tile_size)
+
+
+def compute_tile_digests(pixels: np.ndarray, tile_size: int) -> List[str]:
+    """Hash every tile of an image in row-major order"""
+    rows, cols = _tile_grid(pixels.shape[:2], tile_size)
+    digests = []
+    for row in range(rows):
+        band = pixels[row * tile_size:(row + 1) * tile_size]
+        for col in range(cols):
+            tile = np.ascontiguousarray(band[:, col * tile_size:(col + 1) * tile_size])
+            digests.append(hashlib.blake2b(tile.tobytes(), digest_size=16).hexdigest())
+    return digests
+
+
+def _digest_path(baseline_path: Path) -> Path:
+    return baseline_path.with_suffix(".tiles.json")
+
+
+def _hash_file(path: Path) -> str:
+    """Hash the raw bytes of a file"""
+    with open(path, 'rb') as f:
+        return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+
+
+def _load_baseline_digests(baseline_path: Path, pixels: np.ndarray, tile_size: int) -> List[str]:
+    """Read cached baseline tile digests, recomputing them when the baseline file changed"""
+    digest_file = _digest_path(baseline_path)
+    if digest_file.exists():
+        with open(digest_file, 'r') as f:
+            cached = json.load(f)
+        # Baselines can be replaced by a pull or a manual copy, so match the cache to the file
+        if (cached.get("tile_size") == tile_size and cached.get("shape") == list(pixels.shape)
+                and cached.get("baseline_hash") == _hash_file(baseline_path)):
+            return cached["digests"]
+
+    digests = compute_tile_digests(pixels, tile_size)
+    write_baseline_digests(baseline_path, pixels, tile_size, digests)
+    return digests
+
+
+def write_baseline_digests(baseline_path: Path, pixels: np.ndarray, tile_size: int,
+                           digests: Optional[List[str]] = None) -> None:
+    """Store tile digests next to a baseline so later runs skip re-hashing it"""
+    if digests is None:
+        digests = compute_tile_digests(pixels, tile_size)
+    with open(_digest_path(baseline_path), 'w') as f:
+        json.dump({"tile_size": tile_size, "shape": list(pixels.shape),
+                   "baseline_hash": _hash_file(baseline_path), "digests": digests}, f)
+
+
+def build_ignore_mask(shape: Tuple[int, int], ignore_regions: Sequence[Region]) -> np.ndarray:
+    """Return a boolean mask that is True for pixels that should be compared"""
+    mask = np.ones(shape, dtype=bool)
+    height, width = shape
+    for x, y, region_width, region_height in ignore_regions:
+        x0, y0 = max(int(x), 0), max(int(y), 0)
+        x1, y1 = min(int(x + region_width), width), min(int(y + region_height), height)
+        if x1 > x0 and y1 > y0:
+            mask[y0:y1, x0:x1] = False
+    return mask
+
+
+def _write_diff_image(baseline: np.ndarray, diff_map: np.ndarray, ignore_mask: np.ndarray,
+                      diff_path: Path) -> None:
+    """Render mismatches in red over a dimmed baseline, ignored areas in blue"""
+    gray = baseline.mean(axis=2, keepdims=True).astype(np.uint8) // 3 + 140
+    overlay = np.repeat(gray, 3, axis=2)
+    overlay[~ignore_mask] = (overlay[~ignore_mask] * [0.5, 0.5, 1.0]).astype(np.uint8)
+    overlay[diff_map] = (255, 0, 0)
+    diff_path.parent.mkdir(parents=True, exist_ok=True)
+    Image.fromarray(overlay).save(diff_path)
+
+
+def compare_images(baseline_path: str, actual_path: str, diff_path: str,
+                   tolerance: int = 0, max_diff_ratio: float = 0.0,
+                   ignore_regions: Sequence[Region] = (), tile_size: int = 32) -> Dict[str, Any]:
+    """Compare two screenshots pixel by pixel.
+
+    Tiles whose hashes match the baseline are skipped; the remaining tiles are
+    diffed in one vectorized pass. A pixel mismatches when any channel differs
+    by more than ``tolerance``. Kept at module level so it can run in a worker
+    process.
+    """
+    start = time.perf_counter()
+    baseline = _load_rgb(Path(baseline_path))
+    actual = _load_rgb(Path(actual_path))
+    stats: Dict[str, Any] = {"diff_path": None}
+
+    if baseline.shape != actual.shape:
+        stats.update(
+            passed=False,
+            message=f"Size mismatch: baseline {baseline.shape[1]}x{baseline.shape[0]}, "
+                    f"actual {actual.shape[1]}x{actual.shape[0]}",
+            duration_ms=(time.perf_counter() - start) * 1000,
+        )
+        return stats
+
+    height, width = baseline.shape[:2]
+    rows, cols = _tile_grid((height, width), tile_size)
+    baseline_digests = _load_baseline_digests(Path(baseline_path), baseline, tile_size)
+    actual_digests = compute_tile_digests(actual, tile_size)
+    changed_tiles = np.array(
+        [expected != current for expected, current in zip(baseline_digests, actual_digests)]
+    ).reshape(rows, cols)
+
+    ignore_mask = build_ignore_mask((height, width), ignore_regions)
+    changed_pixels = np.repeat(np.repeat(changed_tiles, tile_size, axis=0), tile_size, axis=1)
+    selected = changed_pixels[:height, :width] & ignore_mask
+
+    diff_map = np.zeros((height, width), dtype=bool)
+    if selected.any():
+        delta = np.abs(baseline[selected].astype(np.int16) - actual[selected].astype(np.int16))
+        diff_map[selected] = delta.max(axis=1) > tolerance
+
+    mismatched = int(diff_map.sum())
+    compared = int(ignore_mask.sum())
+    ratio = mismatched / compared if compared else 0.0
+    passed = ratio <= max_diff_ratio
+
+    if mismatched:
+        _write_diff_image(baseline, diff_map, ignore_mask, Path(diff_path))
+        stats["diff_path"] = diff_path
+
+    stats.update(
+        passed=passed,
+        mismatched_pixels=mismatched,
+        compared_pixels=compared,
+        mismatch_ratio=ratio,
+        tiles_total=rows * cols,
+        tiles_skipped=int((~changed_tiles).sum()),
+        message="" if passed else f"{mismatched} pixels ({ratio:.4%}) differ from baseline",
+        duration_ms=(time.perf_counter() - start) * 1000,
+    )
+    return stats
+
+
+class VisualComparator:
+    """Stores screenshot baselines per page and viewport and compares new screenshots"""
+
+    def __init__(self, baseline_dir: str = "tests/visual_baselines",
+                 output_dir: str = "reports/visual",
+                 tolerance: int = 0, max_diff_ratio: float = 0.0, tile_size: int = 32,
+                 update_baselines: bool = False, workers: int = 4, parallel_threshold: int = 4):
+        self.baseline_dir = Path(baseline_dir)
+        self.output_dir = Path(output_dir)
+        self.tolerance = tolerance
+        self.max_diff_ratio = max_diff_ratio
+        self.tile_size = tile_size
+        self.update_baselines = update_baselines
+        self.workers = workers
+        self.parallel_threshold = parallel_threshold
+        self.results: List[ComparisonResult] = []
+
+    @classmethod
+    def from_config(cls) -> "VisualComparator":
+        """Create a comparator from the ``visual`` configuration section"""
+        return cls(**Config.get_visual_config())
+
+    def get_baseline_path(self, page_name: str, name: str, viewport: Dict[str, int]) -> Path:
+        """Return the baseline location for a page, viewport and screenshot name"""
+        viewport_dir = f"{viewport['width']}x{viewport['height']}"
+        return self.baseline_dir / page_name / viewport_dir / f"{name}.png"
+
+    def _get_diff_path(self, request: ComparisonRequest) -> Path:
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S_%f')[:-3]
+        return self.output_dir / "diffs" / f"{request.page_name}_{request.name}_{timestamp}.png"
+
+    def _store_baseline(self, request: ComparisonRequest, baseline_path: Path) -> ComparisonResult:
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(request.actual_path, baseline_path)
+        write_baseline_digests(baseline_path, _load_rgb(baseline_path), self.tile_size)
+        logger.info(f"Stored visual baseline: {baseline_path}")
+        return ComparisonResult(
+            page_name=request.page_name,
+            name=request.name,
+            baseline_path=str(baseline_path),
+            actual_path=request.actual_path,
+            passed=True,
+            new_baseline=True,
+            message="Baseline created",
+        )
+
+    def _compare_args(self, request: ComparisonRequest, baseline_path: Path) -> Tuple:
+        return (str(baseline_path), request.actual_path, str(self._get_diff_path(request)),
+                self.tolerance, self.max_diff_ratio, list(request.ignore_regions), self.tile_size)
+
+    def _to_result(self, request: ComparisonRequest, baseline_path: Path,
+                   stats: Dict[str, Any]) -> ComparisonResult:
+        result = ComparisonResult(
+            page_name=request.page_name,
+            name=request.name,
+            baseline_path=str(baseline_path),
+            actual_path=request.actual_path,
+            **stats,
+        )
+        if result.passed:
+            logger.info(f"Visual check passed: {request.page_name}/{request.name} "
+                        f"({result.tiles_skipped}/{result.tiles_total} tiles unchanged, "
+                        f"{result.duration_ms:.1f} ms)")
+        else:
+            logger.error(f"Visual check failed: {request.page_name}/{request.name} - "
+                         f"{result.message}")
+        return result
+
+    def compare(self, request: ComparisonRequest) -> ComparisonResult:
+        """Compare one screenshot, creating the baseline if it does not exist yet"""
+        return self.compare_many([request])[0]
+
+    def compare_many(self, requests: Sequence[ComparisonRequest]) -> List[ComparisonResult]:
+        """Compare a batch of screenshots, using a process pool for large batches"""
+        results: List[Optional[ComparisonResult]] = [None] * len(requests)
+        pending = []
+
+        for index, request in enumerate(requests):
+            baseline_path = self.get_baseline_path(request.page_name, request.name,
+                                                   request.viewport)
+            if self.update_baselines or not baseline_path.exists():
+                results[index] = self._store_baseline(request, baseline_path)
+            else:
+                pending.append((index, request, baseline_path))
+
+        if len(pending) >= self.parallel_threshold and self.workers > 1:
+            logger.info(f"Comparing {len(pending)} screenshots on {self.workers} processes")
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                futures = [
+                    executor.submit(compare_images, *self._compare_args(request, baseline_path))
+                    for _, request, baseline_path in pending
+                ]
+                all_stats = [future.result() for future in futures]
+        else:
+            all_stats = [compare_images(*self._compare_args(request, baseline_path))
+                         for _, request, baseline_path in pending]
+
+        for (index, request, baseline_path), stats in zip(pending, all_stats):
+            results[index] = self._to_result(request, baseline_path, stats)
+
+        self.results.extend(results)
+        return results
+
+    def write_report(self) -> Optional[Path]:
+        """Write comparison results and timing totals to the reports folder"""
+        if not self.results:
+            return None
+
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        report_path = self.output_dir / "visual_report.json"
+        compared = [result for result in self.results if not result.new_baseline]
+        summary = {
+            "total": len(self.results),
+            "passed": sum(1 for result in self.results if result.passed),
+            "failed": sum(1 for result in self.results if not result.passed),
+            "new_baselines": len(self.results) - len(compared),
+            "total_duration_ms": sum(result.duration_ms for result in compared),
+            "tiles_total": sum(result.tiles_total for result in compared),
+            "tiles_skipped": sum(result.tiles_skipped for result in compared),
+        }
+        with open(report_path, 'w') as f:
+            json.dump({"summary": summary, "results": [asdict(result) for result in self.results]},
+                      f, indent=2)
+
+        logger.info(f"Visual regression report saved: {report_path}")
+        return report_path